@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal, QTimer, QPoint, QRect, QSize
 from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QRadialGradient, QFont
+from collections.abc import Iterable
 from typing import Optional, Tuple, List
 
 from client.shell.styles.theme import CURRENT_THEME as t
@@ -40,20 +41,46 @@ class GomokuBoard(QWidget):
         # 样式
         self.setStyleSheet("background: transparent;")
     
-    def set_board(self, board: List[List[int]]):
-        """设置棋盘状态"""
+    def set_board(self, board: List[List[int]],
+                  changed: Iterable[tuple[int, int]] | None = None):
+        """设置棋盘状态
+
+        changed 为有变化的格子 (row, col)；给出时只重绘这些格子，否则整盘重绘。
+        """
         self.board = board
-        self.update()
+        if changed is None:
+            self.update()
+        else:
+            self.update_cells(changed)
     
     def set_state(self, current_player: int, my_color: int, 
                   last_move: Optional[Tuple[int, int]], winner: int):
-        """设置游戏状态"""
+        """设置游戏状态（只重绘受影响的格子）"""
+        dirty = []
+        if last_move != self.last_move:
+            dirty.extend(m for m in (self.last_move, last_move) if m)
+
+        is_my_turn = (current_player == my_color and winner == 0)
+        if self.hover_pos and (is_my_turn != self.is_my_turn or my_color != self.my_color):
+            dirty.append(self.hover_pos)
+
         self.current_player = current_player
         self.my_color = my_color
         self.last_move = last_move
         self.winner = winner
-        self.is_my_turn = (current_player == my_color and winner == 0)
-        self.update()
+        self.is_my_turn = is_my_turn
+        self.update_cells(dirty)
+
+    def _cell_rect(self, row: int, col: int) -> QRect:
+        """格子的重绘区域（覆盖棋子与标记）"""
+        x, y = self._board_to_pixel(row, col)
+        half = self.CELL_SIZE // 2 + 1
+        return QRect(x - half, y - half, half * 2, half * 2)
+
+    def update_cells(self, cells: Iterable[tuple[int, int]]):
+        """只把指定格子标记为需要重绘，Qt 会合并成一个区域统一绘制"""
+        for row, col in cells:
+            self.update(self._cell_rect(row, col))
     
     def _board_to_pixel(self, row: int, col: int) -> Tuple[int, int]:
         """棋盘坐标转像素坐标"""
@@ -88,8 +115,8 @@ class GomokuBoard(QWidget):
         if self.hover_pos and self.is_my_turn:
             self._draw_hover(painter, *self.hover_pos)
         
-        # 绘制棋子
-        self._draw_stones(painter)
+        # 绘制棋子（只遍历重绘区域内的格子）
+        self._draw_stones(painter, event.rect())
         
         # 绘制最后落子标记
         if self.last_move:
@@ -159,12 +186,26 @@ class GomokuBoard(QWidget):
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(QPoint(x, y), 14, 14)
     
-    def _draw_stones(self, painter: QPainter):
+    def _draw_stones(self, painter: QPainter, rect: QRect | None = None):
         """绘制棋子"""
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                stone = self.board[row][col]
-                if stone != 0:
+        first_row = first_col = 0
+        last_row = last_col = self.BOARD_SIZE - 1
+        if rect is not None:
+            # 重绘区域换算成行列范围（向外多取一格，覆盖棋子半径）
+            cell, margin = self.CELL_SIZE, self.MARGIN
+            first_row = max(first_row, (rect.top() - margin) // cell)
+            last_row = min(last_row, (rect.bottom() - margin) // cell + 1)
+            first_col = max(first_col, (rect.left() - margin) // cell)
+            last_col = min(last_col, (rect.right() - margin) // cell + 1)
+
+        # 按行遍历，整行为空时直接跳过（开局阶段绝大多数行都是空的）
+        for row in range(first_row, last_row + 1):
+            line = self.board[row]
+            if not any(line):
+                continue
+            for col in range(first_col, last_col + 1):
+                stone = line[col]
+                if stone:
                     self._draw_stone(painter, row, col, stone)
     
     def _draw_stone(self, painter: QPainter, row: int, col: int, color: int):
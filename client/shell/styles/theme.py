@@ -3,7 +3,8 @@
 采用 Apple Design / Material 3 融合风格
 强调：弥散阴影、微渐变、精细排版、流畅动效
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from types import SimpleNamespace
 from typing import Dict
 
 
@@ -51,8 +52,77 @@ class Theme:
     # 字体 (Fonts)
     font_family: str
     
+    def __post_init__(self):
+        self.rebuild_qss()
+
     def to_dict(self) -> Dict[str, str]:
-        return self.__dict__
+        # 只导出色值等设计令牌，预编译的组件样式放在 self.qss 里
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def rebuild_qss(self):
+        """预编译组件样式字符串，色值变化（切换主题）后调用一次即可"""
+        # 好友列表：行内容由委托直接绘制，这里只需要视图本身的样式
+        friend_list = """
+            QListView {
+                background: transparent;
+                border: none;
+            }
+        """
+
+        # 创建房间对话框
+        dialog_title = f"""
+            font-size: 24px;
+            font-weight: 700;
+            color: {self.text_display};
+        """
+        field_label = f"font-size: 14px; font-weight: 600; color: {self.text_body};"
+        spin_box = f"""
+            QSpinBox {{
+                background-color: {self.bg_base};
+                border: 1px solid {self.border_normal};
+                border-radius: 8px;
+                padding: 4px 8px;
+                font-size: 14px;
+            }}
+            QSpinBox:focus {{
+                border-color: {self.primary};
+            }}
+        """
+        secondary_btn = f"""
+            QPushButton {{
+                background-color: {self.bg_base};
+                color: {self.text_body};
+                border: 1px solid {self.border_normal};
+                border-radius: 8px;
+                font-size: 14px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background-color: {self.bg_hover};
+            }}
+        """
+        primary_btn = f"""
+            QPushButton {{
+                background-color: {self.primary};
+                color: white;
+                border: none;
+                border-radius: 8px;
+                font-size: 14px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background-color: {self.primary_hover};
+            }}
+        """
+
+        self.qss = SimpleNamespace(
+            friend_list=friend_list,
+            dialog_title=dialog_title,
+            field_label=field_label,
+            spin_box=spin_box,
+            secondary_btn=secondary_btn,
+            primary_btn=primary_btn,
+        )
 
 
 # 2.0 升级版主题
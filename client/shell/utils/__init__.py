@@ -2,6 +2,7 @@
 通用工具模块
 """
 from .animation import AnimationUtils
+from .layout import clear_layout
 
-__all__ = ['AnimationUtils']
+__all__ = ['AnimationUtils', 'clear_layout']
 
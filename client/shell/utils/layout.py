@@ -0,0 +1,17 @@
+"""
+布局工具
+"""
+from PySide6.QtWidgets import QLayout
+
+
+def clear_layout(layout: QLayout, keep_tail: int = 0):
+    """移除并销毁布局中的控件，保留末尾 keep_tail 项（如 stretch）
+
+    从尾部向前 takeAt，避免 takeAt(0) 每次搬移整个列表造成的 O(N²)。
+    控件先 setParent(None) 立即脱离绘制树，再 deleteLater 释放。
+    """
+    for i in range(layout.count() - 1 - keep_tail, -1, -1):
+        widget = layout.takeAt(i).widget()
+        if widget is not None:
+            widget.setParent(None)
+            widget.deleteLater()
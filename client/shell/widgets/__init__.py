@@ -5,11 +5,11 @@ from .login_widget import LoginWidget
 from .lobby_widget import LobbyWidget
 from .game_card import GameCard
 from .rooms_widget import RoomsWidget, RoomCard
-from .friends_widget import FriendsWidget, FriendItem
+from .friends_widget import FriendsWidget, FriendsModel, FriendDelegate, Friend
 from .chat_widget import ChatWidget
 from .game_view import GameViewWidget
 from .notification_widget import NotificationCenter, NotificationItem, ToastNotification
-from .create_room_dialog import CreateRoomDialog, GameTypeButton
+from .create_room_dialog import CreateRoomDialog, GamePickerWidget
 from .register_dialog import RegisterDialog
 from .settings_widget import SettingsWidget, SettingSection, SettingRow
 from .arena_widget import ArenaWidget, GameMeta
@@ -21,11 +21,11 @@ __all__ = [
     'LobbyWidget',
     'GameCard',
     'RoomsWidget', 'RoomCard',
-    'FriendsWidget', 'FriendItem',
+    'FriendsWidget', 'FriendsModel', 'FriendDelegate', 'Friend',
     'ChatWidget',
     'GameViewWidget',
     'NotificationCenter', 'NotificationItem', 'ToastNotification',
-    'CreateRoomDialog', 'GameTypeButton',
+    'CreateRoomDialog', 'GamePickerWidget',
     'RegisterDialog',
     'SettingsWidget', 'SettingSection', 'SettingRow',
     'ArenaWidget', 'GameMeta',
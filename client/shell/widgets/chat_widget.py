@@ -11,6 +11,7 @@ from typing import List, Dict, Any
 from datetime import datetime
 
 from ..styles.theme import CURRENT_THEME as t
+from ..utils.layout import clear_layout
 
 
 class MessageBubble(QWidget):
@@ -265,10 +266,7 @@ class ChatWidget(QWidget):
         self._clear_messages()
     
     def _clear_messages(self):
-        while self.messages_layout.count() > 1:
-            item = self.messages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        clear_layout(self.messages_layout, keep_tail=1)
     
     def add_message(self, msg_data: Dict[str, Any]):
         is_self = msg_data.get('sender_id') == self.local_user_id
@@ -4,44 +4,180 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QPushButton, QComboBox, QSpinBox,
-    QCheckBox, QFrame, QButtonGroup, QRadioButton
+    QCheckBox, QFrame, QWidget, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, Signal, QSignalBlocker, QPoint, QRect, QSize
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
 
 from ..styles.theme import CURRENT_THEME as t
 
 
-class GameTypeButton(QPushButton):
-    """游戏类型选择按钮"""
+# (game_id, 名称, 图标, 主题色, 最大人数)
+_GAMES_LIST = (
+    ('gomoku', '五子棋', '⚫', '#10B981', 2),
+    ('shooter2d', '2D射击', '🔫', '#EF4444', 8),
+    ('werewolf', '狼人杀', '🐺', '#8B5CF6', 12),
+    ('monopoly', '大富翁', '🎲', '#F59E0B', 4),
+    ('racing', '赛车', '🏎️', '#06B6D4', 6),
+)
+_GAMES_BY_ID = {g[0]: g for g in _GAMES_LIST}
+
+
+class GamePickerWidget(QWidget):
+    """游戏类型选择条 - 单控件自绘 + 命中测试，替代按钮组"""
+
+    game_selected = Signal(str)
     
-    def __init__(self, game_id: str, name: str, icon: str, color: str, parent=None):
+    CELL_SIZE = 80
+    CELL_SPACING = 12
+    CELL_RADIUS = 12
+
+    def __init__(self, games=_GAMES_LIST, parent=None):
         super().__init__(parent)
-        self.game_id = game_id
-        self.color = color
+        self._games = games
+        self._rects: list[QRect] = []
+        self._selected_idx = 0
+        self._hover_idx = -1
+
+        # 色值只转换一次
+        self._colors = [QColor(g[3]) for g in games]
+        self._checked_bgs = []
+        for color in self._colors:
+            bg = QColor(color)
+            bg.setAlpha(0x10)
+            self._checked_bgs.append(bg)
+        self._bg = QColor(t.bg_card)
+        self._border = QColor(t.border_light)
+        self._text = QColor(t.text_body)
+
+        self._font = QFont(self.font())
+        self._font.setPixelSize(12)
         
-        self.setText(f"{icon}\n{name}")
-        self.setFixedSize(80, 80)
-        self.setCheckable(True)
+        self.setMouseTracking(True)
         self.setCursor(Qt.PointingHandCursor)
+        # 单控件替代按钮组后，键盘选择和读屏信息都要自己提供
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setAccessibleName("选择游戏")
+        self._update_accessible()
+        self.setFixedHeight(self.CELL_SIZE)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def sizeHint(self) -> QSize:
+        n = len(self._games)
+        return QSize(n * self.CELL_SIZE + (n - 1) * self.CELL_SPACING, self.CELL_SIZE)
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(0, self.CELL_SIZE)
+
+    def selected_game(self) -> str:
+        return self._games[self._selected_idx][0]
+
+    def set_selected_game(self, game_id: str):
+        for idx, game in enumerate(self._games):
+            if game[0] == game_id:
+                self._select(idx)
+                return
+
+    def _select(self, idx: int):
+        if idx == self._selected_idx:
+            return
+        self._selected_idx = idx
+        self._update_accessible()
+        self.update()
+        self.game_selected.emit(self._games[idx][0])
+
+    def _update_accessible(self):
+        name = self._games[self._selected_idx][1]
+        self.setAccessibleDescription(f"当前选择：{name}，左右方向键切换")
+
+    def _layout_cells(self):
+        """按可用宽度排布格子（放不下时等比收窄）"""
+        n = len(self._games)
+        spacing = self.CELL_SPACING
+        size = min(self.CELL_SIZE, (self.width() - (n - 1) * spacing) // n)
+        self._rects = [
+            QRect(i * (size + spacing), 0, size, self.CELL_SIZE) for i in range(n)
+        ]
+
+    def _hit_test(self, pos: QPoint) -> int:
+        for idx, rect in enumerate(self._rects):
+            if rect.contains(pos):
+                return idx
+        return -1
+
+    def resizeEvent(self, event):
+        self._layout_cells()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if not self._rects:
+            self._layout_cells()
         
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {t.bg_card};
-                border: 2px solid {t.border_light};
-                border-radius: 12px;
-                font-size: 12px;
-                color: {t.text_body};
-            }}
-            QPushButton:hover {{
-                border-color: {color};
-            }}
-            QPushButton:checked {{
-                background-color: {color}10;
-                border-color: {color};
-                color: {color};
-            }}
-        """)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._font)
+        radius = self.CELL_RADIUS
+
+        for idx, (rect, game) in enumerate(zip(self._rects, self._games, strict=True)):
+            color = self._colors[idx]
+            checked = idx == self._selected_idx
+
+            painter.setBrush(self._bg)
+            painter.setPen(Qt.NoPen)
+            cell = rect.adjusted(1, 1, -1, -1)
+            painter.drawRoundedRect(cell, radius, radius)
+
+            if checked:
+                painter.setBrush(self._checked_bgs[idx])
+            else:
+                painter.setBrush(Qt.NoBrush)
+            border = color if checked or idx == self._hover_idx else self._border
+            painter.setPen(QPen(border, 2))
+            painter.drawRoundedRect(cell, radius, radius)
+
+            if checked and self.hasFocus():
+                # 键盘焦点提示：选中格内侧再画一圈虚线
+                painter.setBrush(Qt.NoBrush)
+                painter.setPen(QPen(color, 1, Qt.DashLine))
+                focus = cell.adjusted(4, 4, -4, -4)
+                painter.drawRoundedRect(focus, radius - 4, radius - 4)
+
+            painter.setPen(color if checked else self._text)
+            painter.drawText(rect, Qt.AlignCenter, f"{game[2]}\n{game[1]}")
+
+    def mouseMoveEvent(self, event):
+        idx = self._hit_test(event.position().toPoint())
+        if idx != self._hover_idx:
+            self._hover_idx = idx
+            self.update()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        if self._hover_idx != -1:
+            self._hover_idx = -1
+            self.update()
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            idx = self._hit_test(event.position().toPoint())
+            if idx != -1:
+                self._select(idx)
+        super().mousePressEvent(event)
+
+    def keyPressEvent(self, event):
+        last = len(self._games) - 1
+        key = event.key()
+        if key == Qt.Key_Left:
+            self._select(max(self._selected_idx - 1, 0))
+        elif key == Qt.Key_Right:
+            self._select(min(self._selected_idx + 1, last))
+        elif key == Qt.Key_Home:
+            self._select(0)
+        elif key == Qt.Key_End:
+            self._select(last)
+        else:
+            super().keyPressEvent(event)
 
 
 class CreateRoomDialog(QDialog):
@@ -49,14 +185,6 @@ class CreateRoomDialog(QDialog):
     
     room_created = Signal(dict)  # 房间配置
     
-    GAMES = {
-        'gomoku': {'name': '五子棋', 'icon': '⚫', 'color': '#10B981', 'max': 2},
-        'shooter2d': {'name': '2D射击', 'icon': '🔫', 'color': '#EF4444', 'max': 8},
-        'werewolf': {'name': '狼人杀', 'icon': '🐺', 'color': '#8B5CF6', 'max': 12},
-        'monopoly': {'name': '大富翁', 'icon': '🎲', 'color': '#F59E0B', 'max': 4},
-        'racing': {'name': '赛车', 'icon': '🏎️', 'color': '#06B6D4', 'max': 6},
-    }
-    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_game = 'gomoku'
@@ -73,40 +201,22 @@ class CreateRoomDialog(QDialog):
         
         # 标题
         title = QLabel("创建新房间")
-        title.setStyleSheet(f"""
-            font-size: 24px;
-            font-weight: 700;
-            color: {t.text_display};
-        """)
+        title.setStyleSheet(t.qss.dialog_title)
         layout.addWidget(title)
         
         # 游戏类型选择
         game_label = QLabel("选择游戏")
-        game_label.setStyleSheet(f"font-size: 14px; font-weight: 600; color: {t.text_body};")
+        game_label.setStyleSheet(t.qss.field_label)
         layout.addWidget(game_label)
         
-        game_layout = QHBoxLayout()
-        game_layout.setSpacing(12)
-        
-        self.game_buttons = QButtonGroup(self)
-        
-        for game_id, info in self.GAMES.items():
-            btn = GameTypeButton(
-                game_id, info['name'], info['icon'], info['color']
-            )
-            if game_id == 'gomoku':
-                btn.setChecked(True)
-            
-            btn.clicked.connect(lambda checked, gid=game_id: self._on_game_selected(gid))
-            self.game_buttons.addButton(btn)
-            game_layout.addWidget(btn)
-        
-        game_layout.addStretch()
-        layout.addLayout(game_layout)
+        self.game_picker = GamePickerWidget()
+        self.game_picker.set_selected_game(self.selected_game)
+        self.game_picker.game_selected.connect(self._on_game_selected)
+        layout.addWidget(self.game_picker)
         
         # 房间名称
         name_label = QLabel("房间名称")
-        name_label.setStyleSheet(f"font-size: 14px; font-weight: 600; color: {t.text_body};")
+        name_label.setStyleSheet(t.qss.field_label)
         layout.addWidget(name_label)
         
         self.name_input = QLineEdit()
@@ -118,7 +228,7 @@ class CreateRoomDialog(QDialog):
         players_layout = QHBoxLayout()
         
         players_label = QLabel("最大人数")
-        players_label.setStyleSheet(f"font-size: 14px; font-weight: 600; color: {t.text_body};")
+        players_label.setStyleSheet(t.qss.field_label)
         players_layout.addWidget(players_label)
         
         players_layout.addStretch()
@@ -127,18 +237,7 @@ class CreateRoomDialog(QDialog):
         self.players_spin.setRange(2, 12)
         self.players_spin.setValue(2)
         self.players_spin.setFixedSize(80, 36)
-        self.players_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background-color: {t.bg_base};
-                border: 1px solid {t.border_normal};
-                border-radius: 8px;
-                padding: 4px 8px;
-                font-size: 14px;
-            }}
-            QSpinBox:focus {{
-                border-color: {t.primary};
-            }}
-        """)
+        self.players_spin.setStyleSheet(t.qss.spin_box)
         players_layout.addWidget(self.players_spin)
         
         layout.addLayout(players_layout)
@@ -171,38 +270,14 @@ class CreateRoomDialog(QDialog):
         cancel_btn = QPushButton("取消")
         cancel_btn.setFixedHeight(44)
         cancel_btn.setCursor(Qt.PointingHandCursor)
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {t.bg_base};
-                color: {t.text_body};
-                border: 1px solid {t.border_normal};
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {t.bg_hover};
-            }}
-        """)
+        cancel_btn.setStyleSheet(t.qss.secondary_btn)
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(cancel_btn)
         
         create_btn = QPushButton("创建房间")
         create_btn.setFixedHeight(44)
         create_btn.setCursor(Qt.PointingHandCursor)
-        create_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {t.primary};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {t.primary_hover};
-            }}
-        """)
+        create_btn.setStyleSheet(t.qss.primary_btn)
         create_btn.clicked.connect(self._on_create)
         btn_layout.addWidget(create_btn)
         
@@ -211,9 +286,14 @@ class CreateRoomDialog(QDialog):
     def _on_game_selected(self, game_id: str):
         """游戏选择"""
         self.selected_game = game_id
-        info = self.GAMES[game_id]
-        self.players_spin.setMaximum(info['max'])
-        self.players_spin.setValue(min(self.players_spin.value(), info['max']))
+        max_players = _GAMES_BY_ID[game_id][4]
+        # 先改上限再改值会产生中间态信号，屏蔽后只发出最终值
+        old_value = self.players_spin.value()
+        with QSignalBlocker(self.players_spin):
+            self.players_spin.setMaximum(max_players)
+            self.players_spin.setValue(min(old_value, max_players))
+        if self.players_spin.value() != old_value:
+            self.players_spin.valueChanged.emit(self.players_spin.value())
     
     def _on_private_toggled(self, checked: bool):
         """私密开关"""
@@ -225,7 +305,7 @@ class CreateRoomDialog(QDialog):
         """创建房间"""
         name = self.name_input.text().strip()
         if not name:
-            name = f"{self.GAMES[self.selected_game]['name']}房间"
+            name = f"{_GAMES_BY_ID[self.selected_game][1]}房间"
         
         config = {
             'game_type': self.selected_game,
@@ -242,7 +322,7 @@ class CreateRoomDialog(QDialog):
         """获取房间配置"""
         return {
             'game_type': self.selected_game,
-            'name': self.name_input.text().strip() or f"{self.GAMES[self.selected_game]['name']}房间",
+            'name': self.name_input.text().strip() or f"{_GAMES_BY_ID[self.selected_game][1]}房间",
             'max_players': self.players_spin.value(),
             'is_private': self.private_check.isChecked(),
             'password': self.password_input.text() if self.private_check.isChecked() else ''
@@ -1,120 +1,351 @@
 """
 好友列表组件 - 修复布局
 """
+from dataclasses import dataclass, fields, replace
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QFrame, QScrollArea
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QFrame,
+    QListView, QAbstractItemView, QStyledItemDelegate, QStackedLayout
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QEvent, QPoint, QRect, QRectF, QSize,
+    QAbstractListModel, QModelIndex
 )
-from PySide6.QtCore import Qt, Signal
-from typing import List, Dict, Any
+from PySide6.QtGui import QColor, QFont, QGuiApplication, QPainter, QPen, QPixmap
+from typing import Any
 
 from ..styles.theme import CURRENT_THEME as t
 
 
-class FriendItem(QWidget):
-    """好友项"""
+@dataclass(slots=True)
+class Friend:
+    """好友记录（入库时从 dict 转换一次，渲染时直接读属性）"""
+    user_id: str = ""
+    nickname: str = "Unknown"
+    avatar: str = "👤"
+    is_online: bool = False
+    in_game: bool = False
+    current_game: str = "游戏中"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'Friend':
+        return cls(
+            user_id=data.get('user_id', ''),
+            nickname=data.get('nickname', 'Unknown'),
+            avatar=data.get('avatar', '👤'),
+            is_online=bool(data.get('is_online', False)),
+            in_game=bool(data.get('in_game', False)),
+            current_game=data.get('current_game', '游戏中'),
+        )
+
+
+_FRIEND_FIELDS = frozenset(f.name for f in fields(Friend))
+
+AVATAR_SIZE = 40
+
+# (emoji, 是否在线) -> 合成好的头像位图（底圆 + emoji + 在线点），所有行共享
+_AVATAR_CACHE: dict[tuple[str, bool], QPixmap] = {}
+
+
+def _get_avatar_pixmap(emoji: str, is_online: bool) -> QPixmap:
+    """把头像整体绘制成一张位图并缓存，委托绘制每行时直接贴图"""
+    key = (emoji, is_online)
+    pixmap = _AVATAR_CACHE.get(key)
+    if pixmap is None:
+        size = AVATAR_SIZE
+        ratio = QGuiApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # 底圆
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(t.bg_base))
+        painter.drawEllipse(0, 0, size, size)
+
+        # emoji
+        font = QFont()
+        font.setPixelSize(20)
+        painter.setFont(font)
+        painter.setPen(QColor(t.text_display))
+        painter.drawText(0, 0, size, size, Qt.AlignCenter, emoji)
+
+        # 在线状态点（白色描边）
+        if is_online:
+            painter.setPen(QPen(QColor("white"), 2))
+            painter.setBrush(QColor(t.success))
+            painter.drawEllipse(QRectF(size - 11, size - 11, 10, 10))
+
+        painter.end()
+        _AVATAR_CACHE[key] = pixmap
+    return pixmap
+
+
+class FriendsModel(QAbstractListModel):
+    """好友列表模型 - 行为分组标题或好友记录"""
+
+    KindRole = Qt.UserRole + 1     # 'header' / 'friend'
+    FriendRole = Qt.UserRole + 2   # Friend 记录
+    SectionRole = Qt.UserRole + 3  # 分组 key（仅标题行）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 行：('header', (文字, 分组 key)) 或 ('friend', Friend)
+        self._rows: list[tuple[str, Any]] = []
+
+    def set_rows(self, rows: list[tuple[str, Any]]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=None) -> int:
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        kind, data = self._rows[index.row()]
+        if role == self.KindRole:
+            return kind
+        if kind == 'header':
+            if role == Qt.DisplayRole:
+                return data[0]
+            if role == self.SectionRole:
+                return data[1]
+            return None
+        if role == Qt.DisplayRole:
+            return data.nickname
+        if role == self.FriendRole:
+            return data
+        return None
+
+    def flags(self, index: QModelIndex):
+        # 只需点击，不需要选中/焦点
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+
+class FriendDelegate(QStyledItemDelegate):
+    """好友行绘制 - 头像、昵称、状态、邀请按钮全部由 QPainter 直接绘制"""
     
     invite_clicked = Signal(str)
     
-    def __init__(self, user_data: Dict[str, Any], parent=None):
+    ITEM_HEIGHT = 60
+    HEADER_HEIGHT = 28
+    ROW_SPACING = 2
+    PADDING_X = 12
+    SPACING = 12
+    INVITE_SIZE = QSize(52, 28)
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.user_data = user_data
-        self.setFixedHeight(60)
-        self.setup_ui()
+        # 鼠标悬停中的邀请按钮（好友 user_id）
+        self._hover_invite: str | None = None
         
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(12)
+        self._name_font = QFont()
+        self._name_font.setPixelSize(14)
+        self._name_font.setWeight(QFont.DemiBold)
+        self._status_font = QFont()
+        self._status_font.setPixelSize(12)
+        self._invite_font = QFont(self._status_font)
+        self._invite_font.setWeight(QFont.DemiBold)
+        self._section_font = QFont()
+        self._section_font.setPixelSize(11)
+        self._section_font.setWeight(QFont.DemiBold)
         
-        user = self.user_data
-        is_online = user.get('is_online', False)
-        
-        # 头像容器 - 固定尺寸
-        avatar_container = QWidget()
-        avatar_container.setFixedSize(40, 40)
+        self._colors = {
+            'name': QColor(t.text_display),
+            'offline': QColor(t.text_caption),
+            'online': QColor(t.success),
+            'in_game': QColor(t.secondary),
+            'invite': QColor(t.primary),
+            'invite_bg': QColor(t.primary_bg),
+            'invite_hover': QColor("#DBEAFE"),
+        }
+
+    def sizeHint(self, option, index) -> QSize:
+        if index.data(FriendsModel.KindRole) == 'header':
+            # 离线分组与上方在线列表多留一点间距
+            extra = 4 if index.data(FriendsModel.SectionRole) == 'offline' else 0
+            return QSize(0, self.HEADER_HEIGHT + extra)
+        return QSize(0, self.ITEM_HEIGHT + self.ROW_SPACING)
+
+    def _invite_rect(self, rect: QRect) -> QRect:
+        size = self.INVITE_SIZE
+        return QRect(
+            rect.right() + 1 - self.PADDING_X - size.width(),
+            rect.top() + (self.ITEM_HEIGHT - size.height()) // 2,
+            size.width(), size.height()
+        )
+
+    def paint(self, painter: QPainter, option, index):
+        painter.save()
+        if index.data(FriendsModel.KindRole) == 'header':
+            self._paint_header(painter, option.rect, index.data(Qt.DisplayRole))
+        else:
+            self._paint_friend(painter, option.rect, index.data(FriendsModel.FriendRole))
+        painter.restore()
+
+    def _paint_header(self, painter: QPainter, rect: QRect, text: str):
+        painter.setFont(self._section_font)
+        painter.setPen(self._colors['offline'])
+        painter.drawText(
+            rect.adjusted(self.PADDING_X, 0, -self.PADDING_X, -4),
+            Qt.AlignLeft | Qt.AlignBottom, text
+        )
+
+    def _paint_friend(self, painter: QPainter, rect: QRect, friend: Friend):
+        colors = self._colors
+        x, y = rect.left(), rect.top()
+        is_online = friend.is_online
         
-        # 头像背景
-        avatar_bg = QFrame(avatar_container)
-        avatar_bg.setGeometry(0, 0, 40, 40)
-        avatar_bg.setStyleSheet(f"""
-            background-color: {t.bg_base};
-            border-radius: 20px;
-        """)
+        painter.drawPixmap(x + self.PADDING_X, y + 10, _get_avatar_pixmap(friend.avatar, is_online))
         
-        # 头像图标
-        avatar_icon = QLabel(user.get('avatar', '👤'), avatar_container)
-        avatar_icon.setGeometry(0, 0, 40, 40)
-        avatar_icon.setAlignment(Qt.AlignCenter)
-        avatar_icon.setStyleSheet("font-size: 20px; background: transparent;")
+        info_x = x + self.PADDING_X + AVATAR_SIZE + self.SPACING
+        info_right = rect.right() + 1 - self.PADDING_X
         
-        # 在线状态点 - 精确定位
+        # 邀请按钮（仅在线时显示）
         if is_online:
-            status_dot = QFrame(avatar_container)
-            status_dot.setGeometry(28, 28, 12, 12)
-            status_dot.setStyleSheet(f"""
-                background-color: {t.success};
-                border: 2px solid white;
-                border-radius: 6px;
-            """)
-        
-        layout.addWidget(avatar_container)
-        
-        # 信息区
-        info_widget = QWidget()
-        info_layout = QVBoxLayout(info_widget)
-        info_layout.setContentsMargins(0, 0, 0, 0)
-        info_layout.setSpacing(2)
+            btn = self._invite_rect(rect)
+            info_right = btn.left() - self.SPACING
+            hovered = self._hover_invite == friend.user_id
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(colors['invite_hover' if hovered else 'invite_bg'])
+            painter.drawRoundedRect(btn, 6, 6)
+            painter.setFont(self._invite_font)
+            painter.setPen(colors['invite'])
+            painter.drawText(btn, Qt.AlignCenter, "邀请")
+
+        info_w = max(0, info_right - info_x)
         
         # 昵称
-        name = QLabel(user.get('nickname', 'Unknown'))
-        name.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {t.text_display};
-        """)
-        info_layout.addWidget(name)
+        painter.setFont(self._name_font)
+        painter.setPen(colors['name'])
+        name = painter.fontMetrics().elidedText(friend.nickname, Qt.ElideRight, info_w)
+        painter.drawText(QRect(info_x, y + 9, info_w, 22), Qt.AlignLeft | Qt.AlignVCenter, name)
         
         # 状态文字
-        if user.get('in_game'):
-            status_text = f"🎮 {user.get('current_game', '游戏中')}"
-            status_color = t.secondary
+        if friend.in_game:
+            status_text = f"🎮 {friend.current_game}"
+            status_state = "in_game"
         elif is_online:
             status_text = "🟢 在线"
-            status_color = t.success
+            status_state = "online"
         else:
             status_text = "⚫ 离线"
-            status_color = t.text_caption
-        
-        status = QLabel(status_text)
-        status.setStyleSheet(f"""
-            font-size: 12px;
-            color: {status_color};
-        """)
-        info_layout.addWidget(status)
+            status_state = "offline"
+        painter.setFont(self._status_font)
+        painter.setPen(colors[status_state])
+        status_text = painter.fontMetrics().elidedText(status_text, Qt.ElideRight, info_w)
+        painter.drawText(QRect(info_x, y + 32, info_w, 18), Qt.AlignLeft | Qt.AlignVCenter, status_text)
+
+    def invite_at(self, rect: QRect, index: QModelIndex, pos: QPoint) -> str | None:
+        """命中测试：pos 落在该行邀请按钮上时返回好友 user_id"""
+        if index.data(FriendsModel.KindRole) != 'friend':
+            return None
+        friend = index.data(FriendsModel.FriendRole)
+        if friend.is_online and self._invite_rect(rect).contains(pos):
+            return friend.user_id
+        return None
+
+    def set_hover_invite(self, user_id: str | None) -> bool:
+        """更新悬停中的邀请按钮，返回是否有变化"""
+        if self._hover_invite == user_id:
+            return False
+        self._hover_invite = user_id
+        return True
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            user_id = self.invite_at(option.rect, index, event.position().toPoint())
+            if user_id is not None:
+                self.invite_clicked.emit(user_id)
+                return True
+        return False
+
+
+class FriendListView(QListView):
+    """好友列表视图 - 模型 + 委托绘制，只绘制视口内的行，不为每行创建控件"""
+
+    invite_clicked = Signal(str)
+    section_clicked = Signal(str)  # 分组标题被点击（分组 key）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.friends_model = FriendsModel(self)
+        self.delegate = FriendDelegate(self)
+        self.setModel(self.friends_model)
+        self.setItemDelegate(self.delegate)
+        self.delegate.invite_clicked.connect(self.invite_clicked.emit)
+        self.clicked.connect(self._on_clicked)
         
-        layout.addWidget(info_widget, 1)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+        self.setStyleSheet(t.qss.friend_list)
+        self.viewport().setAutoFillBackground(False)
+
+    def set_rows(self, rows: list[tuple[str, Any]]):
+        self.friends_model.set_rows(rows)
+
+    @Slot(QModelIndex)
+    def _on_clicked(self, index: QModelIndex):
+        if index.data(FriendsModel.KindRole) == 'header':
+            self.section_clicked.emit(index.data(FriendsModel.SectionRole))
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        hover_id = self.delegate.invite_at(self.visualRect(index), index, pos) if index.isValid() else None
+        if self.delegate.set_hover_invite(hover_id):
+            self.viewport().update()
+        # 标题行与邀请按钮显示手型光标
+        clickable = hover_id is not None or index.data(FriendsModel.KindRole) == 'header'
+        self.viewport().setCursor(Qt.PointingHandCursor if clickable else Qt.ArrowCursor)
+
+    def leaveEvent(self, event):
+        if self.delegate.set_hover_invite(None):
+            self.viewport().update()
+        super().leaveEvent(event)
+
+
+class FriendSearchIndex:
+    """昵称搜索索引 - 二元组倒排表（中文昵称普遍较短，二元组比三元组更适用）"""
+
+    def __init__(self, friends: list[Friend]):
+        self._names: dict[str, str] = {}
+        self._grams: dict[str, set[str]] = {}
+        for f in friends:
+            uid = f.user_id
+            name = f.nickname.casefold()
+            self._names[uid] = name
+            for i in range(len(name) - 1):
+                self._grams.setdefault(name[i:i + 2], set()).add(uid)
+
+    def match(self, query: str) -> set[str]:
+        """返回昵称包含 query 的好友 user_id 集合"""
+        query = query.casefold()
+        names = self._names
+        if len(query) < 2:
+            return {uid for uid, name in names.items() if query in name}
         
-        # 邀请按钮
-        if is_online:
-            invite_btn = QPushButton("邀请")
-            invite_btn.setFixedSize(52, 28)
-            invite_btn.setCursor(Qt.PointingHandCursor)
-            invite_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {t.primary_bg};
-                    color: {t.primary};
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 12px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background-color: #DBEAFE;
-                }}
-            """)
-            invite_btn.clicked.connect(lambda: self.invite_clicked.emit(user.get('user_id', '')))
-            layout.addWidget(invite_btn)
+        postings = []
+        for i in range(len(query) - 1):
+            ids = self._grams.get(query[i:i + 2])
+            if not ids:
+                return set()
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        # 二元组命中不代表连续出现，最后再核对一次子串
+        return {uid for uid in candidates if query in names[uid]}
 
 
 class FriendsWidget(QWidget):
@@ -122,9 +353,22 @@ class FriendsWidget(QWidget):
     
     invite_friend = Signal(str)
     
+    REFRESH_DELAY_MS = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.friends_data: List[Dict] = []
+        self.friends_data: list[Friend] = []
+        # 离线分组默认折叠，展开后才为离线好友生成行
+        self._offline_expanded = False
+        # 搜索索引按需构建，好友数据变化后作废
+        self._search_index: FriendSearchIndex | None = None
+
+        # 合并短时间内的多次更新（如在线状态推送），只刷新一次
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._refresh_list)
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -151,82 +395,86 @@ class FriendsWidget(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 搜索好友...")
         self.search_input.setFixedHeight(36)
+        self.search_input.textChanged.connect(self._refresh_timer.start)
         layout.addWidget(self.search_input)
         
-        # 滚动区域
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
+        # 好友列表（模型/视图，委托绘制）
+        self.list_view = FriendListView()
+        self.list_view.invite_clicked.connect(self.invite_friend.emit)
+        self.list_view.section_clicked.connect(self._on_section_clicked)
         
-        # 好友列表容器
-        self.container = QWidget()
-        self.list_layout = QVBoxLayout(self.container)
-        self.list_layout.setContentsMargins(0, 4, 0, 0)
-        self.list_layout.setSpacing(2)
-        self.list_layout.addStretch()
+        # 空状态只创建一次，与列表放在同一个堆叠布局里切换
+        self.empty_label = QLabel("暂无好友")
+        self.empty_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
+        self.empty_label.setStyleSheet(f"color: {t.text_caption}; padding: 20px;")
         
-        scroll.setWidget(self.container)
-        layout.addWidget(scroll, 1)
+        self.list_stack = QStackedLayout()
+        self.list_stack.addWidget(self.list_view)
+        self.list_stack.addWidget(self.empty_label)
+        self.list_stack.setCurrentWidget(self.empty_label)
+        layout.addLayout(self.list_stack, 1)
 
-    def set_friends(self, friends: List[Dict[str, Any]]):
-        self.friends_data = friends
-        self._refresh_list()
+    def set_friends(self, friends: list[dict[str, Any]]):
+        self.friends_data = [Friend.from_dict(f) for f in friends]
+        self._search_index = None
+        self._refresh_timer.start()
+
+    def update_friend(self, user_id: str, patch: dict[str, Any]) -> bool:
+        """局部更新单个好友（如上下线），返回是否找到该好友"""
+        for i, f in enumerate(self.friends_data):
+            if f.user_id == user_id:
+                self.friends_data[i] = replace(
+                    f, **{k: v for k, v in patch.items() if k in _FRIEND_FIELDS}
+                )
+                if 'nickname' in patch or 'user_id' in patch:
+                    self._search_index = None
+                self._refresh_timer.start()
+                return True
+        return False
+
+    def _matching_ids(self, query: str) -> set[str]:
+        if self._search_index is None:
+            self._search_index = FriendSearchIndex(self.friends_data)
+        return self._search_index.match(query)
 
     def _refresh_list(self):
-        # 清空
-        while self.list_layout.count() > 1:
-            item = self.list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        if not self.friends_data:
-            empty = QLabel("暂无好友")
-            empty.setAlignment(Qt.AlignCenter)
-            empty.setStyleSheet(f"color: {t.text_caption}; padding: 20px;")
-            self.list_layout.insertWidget(0, empty)
-            self.online_count.setText("0 在线")
-            return
-        
-        # 在线排前
-        online = [f for f in self.friends_data if f.get('is_online')]
-        offline = [f for f in self.friends_data if not f.get('is_online')]
+        # 在线排前（单次遍历分组）
+        online: list[Friend] = []
+        offline: list[Friend] = []
+        for f in self.friends_data:
+            (online if f.is_online else offline).append(f)
         
         self.online_count.setText(f"{len(online)} 在线")
         
-        idx = 0
+        query = self.search_input.text().strip()
+        if query:
+            matched = self._matching_ids(query)
+            online = [f for f in online if f.user_id in matched]
+            offline = [f for f in offline if f.user_id in matched]
         
-        # 显示在线好友
+        if not online and not offline:
+            self.list_view.set_rows([])
+            self.empty_label.setText("没有匹配的好友" if query else "暂无好友")
+            self.list_stack.setCurrentWidget(self.empty_label)
+            return
+
+        self.list_stack.setCurrentWidget(self.list_view)
+
+        rows: list[tuple[str, Any]] = []
         if online:
-            online_header = QLabel("在线")
-            online_header.setStyleSheet(f"""
-                font-size: 11px;
-                color: {t.text_caption};
-                padding: 8px 12px 4px;
-                font-weight: 600;
-            """)
-            self.list_layout.insertWidget(idx, online_header)
-            idx += 1
-            
-            for f in online:
-                item = FriendItem(f)
-                item.invite_clicked.connect(self.invite_friend.emit)
-                self.list_layout.insertWidget(idx, item)
-                idx += 1
-        
-        # 显示离线好友
+            rows.append(('header', ("在线", 'online')))
+            rows.extend(('friend', f) for f in online)
         if offline:
-            offline_header = QLabel("离线")
-            offline_header.setStyleSheet(f"""
-                font-size: 11px;
-                color: {t.text_caption};
-                padding: 12px 12px 4px;
-                font-weight: 600;
-            """)
-            self.list_layout.insertWidget(idx, offline_header)
-            idx += 1
-            
-            for f in offline:
-                item = FriendItem(f)
-                self.list_layout.insertWidget(idx, item)
-                idx += 1
+            # 搜索时直接展示离线匹配项
+            expanded = self._offline_expanded or bool(query)
+            arrow = "▾" if expanded else "▸"
+            rows.append(('header', (f"{arrow} 离线 ({len(offline)})", 'offline')))
+            if expanded:
+                rows.extend(('friend', f) for f in offline)
+
+        self.list_view.set_rows(rows)
+
+    def _on_section_clicked(self, section: str):
+        if section == 'offline':
+            self._offline_expanded = not self._offline_expanded
+            self._refresh_list()
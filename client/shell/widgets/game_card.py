@@ -1,63 +1,204 @@
 """
 游戏卡片组件 - 简化稳定版
 """
+import os
+from types import MappingProxyType
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QFrame,
-    QGraphicsDropShadowEffect,
     QPushButton,
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, Signal, QPointF, QRect, QRectF
+from PySide6.QtGui import (
+    QColor, QFont, QFontMetrics, QGuiApplication, QPainter, QPixmap, QRadialGradient
+)
 
 from ..styles.theme import CURRENT_THEME as t
 
 
+_DEFAULT_GRADIENT = (t.primary, "#7C3AED")
+
+GAMES = MappingProxyType({
+    'gomoku': {
+        'name': '五子棋', 'icon': '⚫', 
+        'desc': '黑白对弈，智者争锋',
+        'category': '策略',
+        'players': '2人',
+        'gradient': ('#10B981', '#0D9488'),
+    },
+    'shooter2d': {
+        'name': '2D 射击', 'icon': '🔫', 
+        'desc': '火力全开，生存竞技',
+        'category': '动作',
+        'players': '2-8人',
+        'gradient': ('#F97316', '#DC2626'),
+    },
+    'werewolf': {
+        'name': '狼人杀', 'icon': '🐺', 
+        'desc': '谎言与推理的博弈',
+        'category': '社交',
+        'players': '6-12人',
+        'gradient': ('#8B5CF6', '#4F46E5'),
+    },
+    'monopoly': {
+        'name': '大富翁', 'icon': '🎲', 
+        'desc': '运筹帷幄，商业大亨',
+        'category': '聚会',
+        'players': '2-4人',
+        'gradient': ('#F59E0B', '#F97316'),
+    },
+    'racing': {
+        'name': '赛车竞速', 'icon': '🏎️', 
+        'desc': '极速漂移，超越极限',
+        'category': '竞速',
+        'players': '2-6人',
+        'gradient': ('#06B6D4', '#0284C7'),
+    },
+})
+
+
+def _build_hero_qss(gradient) -> str:
+    """顶部渐变区域样式"""
+    grad_from, grad_to = gradient
+    return f"""
+        QFrame#gameHero {{
+            border-top-left-radius: 20px;
+            border-top-right-radius: 20px;
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 {grad_from}, stop:1 {grad_to});
+        }}
+    """
+
+
+# 每个游戏的渐变样式在模块导入时生成一次，创建卡片时按 game_id 直接取用
+_HERO_QSS = MappingProxyType({
+    gid: _build_hero_qss(info.get("gradient", _DEFAULT_GRADIENT))
+    for gid, info in GAMES.items()
+})
+_DEFAULT_HERO_QSS = _build_hero_qss(_DEFAULT_GRADIENT)
+
+
+def _draw_nine_slice(painter: QPainter, target: QRect, pixmap: QPixmap, margin: int):
+    """九宫格绘制：四角原样贴图，四边与中心拉伸填充"""
+    ratio = pixmap.devicePixelRatio()
+    src_w = round(pixmap.width() / ratio)
+    src_h = round(pixmap.height() / ratio)
+    m = min(margin, target.width() // 2, target.height() // 2)
+
+    xs_src = (0, m, src_w - m, src_w)
+    ys_src = (0, m, src_h - m, src_h)
+    xs_dst = (target.left(), target.left() + m, target.right() + 1 - m, target.right() + 1)
+    ys_dst = (target.top(), target.top() + m, target.bottom() + 1 - m, target.bottom() + 1)
+    for row in range(3):
+        for col in range(3):
+            dst = QRect(xs_dst[col], ys_dst[row],
+                        xs_dst[col + 1] - xs_dst[col], ys_dst[row + 1] - ys_dst[row])
+            if dst.isEmpty():
+                continue
+            src = QRectF(xs_src[col] * ratio, ys_src[row] * ratio,
+                         (xs_src[col + 1] - xs_src[col]) * ratio,
+                         (ys_src[row + 1] - ys_src[row]) * ratio)
+            painter.drawPixmap(QRectF(dst), pixmap, src)
+
+
 class GameCard(QWidget):
     """游戏卡片"""
     
     clicked = Signal(str)
     
-    GAMES = {
-        'gomoku': {
-            'name': '五子棋', 'icon': '⚫', 
-            'desc': '黑白对弈，智者争锋',
-            'category': '策略',
-            'players': '2人',
-            'gradient': ('#10B981', '#0D9488'),
-        },
-        'shooter2d': {
-            'name': '2D 射击', 'icon': '🔫', 
-            'desc': '火力全开，生存竞技',
-            'category': '动作',
-            'players': '2-8人',
-            'gradient': ('#F97316', '#DC2626'),
-        },
-        'werewolf': {
-            'name': '狼人杀', 'icon': '🐺', 
-            'desc': '谎言与推理的博弈',
-            'category': '社交',
-            'players': '6-12人',
-            'gradient': ('#8B5CF6', '#4F46E5'),
-        },
-        'monopoly': {
-            'name': '大富翁', 'icon': '🎲', 
-            'desc': '运筹帷幄，商业大亨',
-            'category': '聚会',
-            'players': '2-4人',
-            'gradient': ('#F59E0B', '#F97316'),
-        },
-        'racing': {
-            'name': '赛车竞速', 'icon': '🏎️', 
-            'desc': '极速漂移，超越极限',
-            'category': '竞速',
-            'players': '2-6人',
-            'gradient': ('#06B6D4', '#0284C7'),
-        }
-    }
+    # 游戏元数据为模块级只读表，所有卡片共享同一份引用
+    GAMES = GAMES
+
+    # 扁平模式：不绘制阴影，改用稍深的边框保留层次（AETHER_FLAT_UI=1 开启）
+    FLAT_MODE = os.environ.get("AETHER_FLAT_UI", "0") == "1"
+
+    # 阴影参数：(模糊半径, 纵向偏移, 透明度)
+    # 模糊半径上限 16：卡片外边距只有 6~10px，更大的半径大部分会被裁掉，只会放大缓存位图
+    _SHADOW = (16, 8, 16)
+    CARD_RADIUS = 20
+
+    # (模糊半径, 透明度) -> 预先模糊好的九宫格阴影位图，所有卡片共享
+    _SHADOW_CACHE = {}
+
+    ICON_SIZE = 52
+    # emoji -> 预先栅格化的图标，同一游戏的卡片共享
+    _ICON_CACHE = {}
+
+    # 描述文字可用宽度：卡片 208 - 左右内边距 16 * 2（卡片定宽，所以是常量）
+    DESC_WIDTH = 176
+    # 描述原文 -> 按 DESC_WIDTH 预先折好的文本
+    _WRAPPED_DESC = {}
+
+    # 样式与实例无关，类加载时生成一次，所有卡片共享
+    # 整张卡片一份样式表挂在 self.card 上，子控件只设 objectName；
+    # 选择器都带 objectName：裸 QFrame 选择器会级联到内部所有 QLabel，
+    # 鼠标在卡片内移动时每个标签都要随 :hover 重新计算样式
+    _CARD_QSS = f"""
+        QFrame#gameCard {{
+            background-color: #FFFFFF;
+            border: 1px solid {t.border_light};
+            border-radius: 20px;
+        }}
+        QFrame#gameCard:hover {{
+            border-color: {t.primary};
+        }}
+        QLabel#gameIcon {{
+            background: transparent;
+        }}
+        QLabel#gameCategory {{
+            background-color: rgba(255, 255, 255, 0.20);
+            border: 1px solid rgba(255, 255, 255, 0.25);
+            color: white;
+            padding: 3px 10px;
+            border-radius: 10px;
+            font-size: 11px;
+            font-weight: 800;
+        }}
+        QLabel#gameName {{
+            font-size: 16px;
+            font-weight: 900;
+            color: {t.text_display};
+        }}
+        QLabel#gamePlayers {{
+            background-color: {t.bg_hover};
+            color: {t.text_caption};
+            border: 1px solid {t.border_light};
+            padding: 3px 8px;
+            border-radius: 10px;
+            font-size: 11px;
+            font-weight: 800;
+        }}
+        QLabel#gameDesc {{
+            font-size: 12px;
+            color: {t.text_caption};
+            font-weight: 600;
+        }}
+        QPushButton#gameCta {{
+            background-color: {t.bg_hover};
+            color: {t.text_display};
+            border: 1px solid {t.border_normal};
+            border-radius: 14px;
+            font-size: 12px;
+            font-weight: 900;
+        }}
+        QPushButton#gameCta:hover {{
+            background-color: {t.primary};
+            color: white;
+            border-color: {t.primary};
+        }}
+    """
+    _FLAT_CARD_QSS = _CARD_QSS + f"""
+        QFrame#gameCard {{
+            border-color: {t.border_normal};
+        }}
+        QFrame#gameCard:hover {{
+            border-color: {t.primary};
+        }}
+    """
     
     def __init__(self, game_id: str, parent=None):
         super().__init__(parent)
@@ -70,7 +211,7 @@ class GameCard(QWidget):
         self.setup_ui()
         
     def setup_ui(self):
-        grad_from, grad_to = self.info.get("gradient", (t.primary, "#7C3AED"))
+        info = self.info
 
         # 主布局（外边距用于阴影空间）
         layout = QVBoxLayout(self)
@@ -78,23 +219,10 @@ class GameCard(QWidget):
         
         # 卡片主体
         self.card = QFrame()
-        self.card.setStyleSheet(f"""
-            QFrame {{
-                background-color: #FFFFFF;
-                border: 1px solid {t.border_light};
-                border-radius: 20px;
-            }}
-            QFrame:hover {{
-                border-color: {t.primary};
-            }}
-        """)
+        self.card.setObjectName("gameCard")
+        self.card.setStyleSheet(self._FLAT_CARD_QSS if self.FLAT_MODE else self._CARD_QSS)
         
-        # 阴影
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(24)
-        shadow.setOffset(0, 8)
-        shadow.setColor(QColor(0, 0, 0, 16))
-        self.card.setGraphicsEffect(shadow)
+        # 阴影不挂 QGraphicsEffect，由 paintEvent 在卡片背后贴缓存位图（扁平模式下不画）
         
         # 内部布局
         inner = QVBoxLayout(self.card)
@@ -103,47 +231,26 @@ class GameCard(QWidget):
 
         # 顶部渐变区域
         hero = QFrame()
+        hero.setObjectName("gameHero")
         hero.setFixedHeight(96)
-        hero.setStyleSheet(
-            f"""
-            QFrame {{
-                border-top-left-radius: 20px;
-                border-top-right-radius: 20px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {grad_from}, stop:1 {grad_to});
-            }}
-            """
-        )
-        hero_layout = QVBoxLayout(hero)
+        hero.setStyleSheet(_HERO_QSS.get(self.game_id, _DEFAULT_HERO_QSS))
+        # 顶部只有一行（图标 + 分类），直接用横向布局，不再嵌套一层
+        hero_layout = QHBoxLayout(hero)
         hero_layout.setContentsMargins(14, 12, 14, 12)
         hero_layout.setSpacing(8)
 
-        top_row = QHBoxLayout()
-        top_row.setContentsMargins(0, 0, 0, 0)
-        top_row.setSpacing(8)
-
-        icon = QLabel(self.info.get("icon", "🎮"))
-        icon.setFixedSize(52, 52)
+        icon = QLabel()
+        icon.setPixmap(self._icon_pixmap(info.get("icon", "🎮")))
+        icon.setFixedSize(self.ICON_SIZE, self.ICON_SIZE)
         icon.setAlignment(Qt.AlignCenter)
-        icon.setStyleSheet("font-size: 28px; background: transparent;")
-        top_row.addWidget(icon)
+        icon.setObjectName("gameIcon")
+        hero_layout.addWidget(icon)
 
-        top_row.addStretch()
+        hero_layout.addStretch()
 
-        category = QLabel(self.info.get("category", "对战"))
-        category.setStyleSheet(
-            """
-            background-color: rgba(255, 255, 255, 0.20);
-            border: 1px solid rgba(255, 255, 255, 0.25);
-            color: white;
-            padding: 3px 10px;
-            border-radius: 10px;
-            font-size: 11px;
-            font-weight: 800;
-            """
-        )
-        top_row.addWidget(category)
-        hero_layout.addLayout(top_row)
+        category = QLabel(info.get("category", "对战"))
+        category.setObjectName("gameCategory")
+        hero_layout.addWidget(category)
         inner.addWidget(hero)
 
         body = QWidget()
@@ -156,61 +263,131 @@ class GameCard(QWidget):
         row.setContentsMargins(0, 0, 0, 0)
         row.setSpacing(10)
 
-        name = QLabel(self.info.get("name", "未知"))
-        name.setStyleSheet(f"font-size: 16px; font-weight: 900; color: {t.text_display};")
+        name = QLabel(info.get("name", "未知"))
+        name.setObjectName("gameName")
         row.addWidget(name, 1)
 
-        players = QLabel(f"👥 {self.info.get('players', '?')}")
-        players.setStyleSheet(
-            f"""
-            background-color: {t.bg_hover};
-            color: {t.text_caption};
-            border: 1px solid {t.border_light};
-            padding: 3px 8px;
-            border-radius: 10px;
-            font-size: 11px;
-            font-weight: 800;
-            """
-        )
+        players = QLabel(f"👥 {info.get('players', '?')}")
+        players.setObjectName("gamePlayers")
         row.addWidget(players)
         body_layout.addLayout(row)
 
         # 描述
-        desc = QLabel(self.info.get("desc", ""))
-        desc.setWordWrap(True)
+        desc = QLabel(self._wrap_desc(info.get("desc", "")))
         desc.setFixedHeight(36)
-        desc.setStyleSheet(f"font-size: 12px; color: {t.text_caption}; font-weight: 600;")
+        desc.setObjectName("gameDesc")
         body_layout.addWidget(desc)
 
         # CTA
         self.cta = QPushButton("开始游戏")
         self.cta.setCursor(Qt.PointingHandCursor)
         self.cta.setFixedHeight(36)
-        self.cta.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {t.bg_hover};
-                color: {t.text_display};
-                border: 1px solid {t.border_normal};
-                border-radius: 14px;
-                font-size: 12px;
-                font-weight: 900;
-            }}
-            QPushButton:hover {{
-                background-color: {t.primary};
-                color: white;
-                border-color: {t.primary};
-            }}
-            """
-        )
+        self.cta.setObjectName("gameCta")
         self.cta.clicked.connect(lambda: self.clicked.emit(self.game_id))
         body_layout.addWidget(self.cta)
 
         body_layout.addStretch(1)
         inner.addWidget(body, 1)
 
+        # 纯展示的标签不参与鼠标命中测试，点击/移动事件直接交给卡片
+        for label in (icon, category, name, players, desc):
+            label.setAttribute(Qt.WA_TransparentForMouseEvents)
+
         layout.addWidget(self.card)
 
+    # 径向渐变的衰减采样数，用 smoothstep 近似高斯边缘
+    _SHADOW_STOPS = 6
+
+    @classmethod
+    def _shadow_pixmap(cls, blur: int, alpha: int) -> QPixmap:
+        """取（或生成）阴影位图，之后按九宫格拉伸复用
+
+        中间只留 1px 可拉伸区域，四个圆角的圆心重合在位图中心，
+        所以整张图就是一个径向渐变：圆角半径内为实色，向外 blur 宽度内衰减到透明。
+        """
+        key = (blur, alpha)
+        pixmap = cls._SHADOW_CACHE.get(key)
+        if pixmap is None:
+            radius = cls.CARD_RADIUS
+            size = 2 * (blur + radius) + 1
+            ratio = QGuiApplication.instance().devicePixelRatio()
+            pixmap = QPixmap(round(size * ratio), round(size * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+
+            outer = radius + blur / 2
+            inner = max(0.0, radius - blur / 2)
+            gradient = QRadialGradient(QPointF(size / 2, size / 2), outer)
+            gradient.setColorAt(0, QColor(0, 0, 0, alpha))
+            steps = cls._SHADOW_STOPS
+            for i in range(steps + 1):
+                x = i / steps
+                falloff = 1 - x * x * (3 - 2 * x)
+                gradient.setColorAt(
+                    (inner + (outer - inner) * x) / outer,
+                    QColor(0, 0, 0, round(alpha * falloff))
+                )
+
+            painter = QPainter(pixmap)
+            painter.fillRect(QRectF(0, 0, size, size), gradient)
+            painter.end()
+            cls._SHADOW_CACHE[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def _icon_pixmap(cls, emoji: str) -> QPixmap:
+        """emoji 只排版绘制一次，之后以位图显示"""
+        pixmap = cls._ICON_CACHE.get(emoji)
+        if pixmap is None:
+            size = cls.ICON_SIZE
+            ratio = QGuiApplication.instance().devicePixelRatio()
+            pixmap = QPixmap(round(size * ratio), round(size * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+
+            font = QFont()
+            font.setPixelSize(28)
+            painter = QPainter(pixmap)
+            painter.setFont(font)
+            painter.setPen(QColor(t.text_body))
+            painter.drawText(0, 0, size, size, Qt.AlignCenter, emoji)
+            painter.end()
+            cls._ICON_CACHE[emoji] = pixmap
+        return pixmap
+
+    @classmethod
+    def _wrap_desc(cls, text: str) -> str:
+        """按字符贪心折行（描述为中文短句，无需按词断行），结果缓存"""
+        wrapped = cls._WRAPPED_DESC.get(text)
+        if wrapped is None:
+            # 与 QLabel#gameDesc 的样式保持一致
+            font = QFont()
+            font.setPixelSize(12)
+            font.setWeight(QFont.DemiBold)
+            fm = QFontMetrics(font)
+
+            lines = []
+            line = ""
+            for ch in text:
+                if line and fm.horizontalAdvance(line + ch) > cls.DESC_WIDTH:
+                    lines.append(line)
+                    line = ch
+                else:
+                    line += ch
+            if line:
+                lines.append(line)
+            wrapped = cls._WRAPPED_DESC[text] = "\n".join(lines)
+        return wrapped
+
+    def paintEvent(self, event):
+        if self.FLAT_MODE:
+            return
+        blur, offset_y, alpha = self._SHADOW
+        target = self.card.geometry().translated(0, offset_y).adjusted(-blur, -blur, blur, blur)
+        painter = QPainter(self)
+        _draw_nine_slice(painter, target, self._shadow_pixmap(blur, alpha), blur + self.CARD_RADIUS)
+        painter.end()
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.clicked.emit(self.game_id)
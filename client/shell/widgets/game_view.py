@@ -2,30 +2,40 @@
 游戏画面容器（Qt 嵌入占位）
 用于展示游戏插件的 render 输出，便于后续接入 Arcade/Panda3D
 """
+import copy
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QFrame
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPlainTextEdit, QFrame
 from PySide6.QtCore import Qt
 
 from ..styles.theme import CURRENT_THEME as t
-from client.plugins.gomoku.widget import GomokuBoard
 
 
 class GameViewWidget(QFrame):
     """游戏渲染区域占位组件"""
 
+    MAX_JSON_LINES = 500
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._title = QLabel("游戏画面")
-        self._content = QTextEdit()
+        # 纯文本按行排版，比富文本 QTextEdit 更新/滚动都轻得多
+        self._content = QPlainTextEdit()
         self._content.setReadOnly(True)
         self._content.setPlaceholderText("等待游戏启动...（可嵌入 Arcade/Panda3D 窗口）")
         self._content.setMinimumHeight(300)
 
-        # 五子棋棋盘展示（默认为隐藏，占位）
-        self._gomoku_board = GomokuBoard()
-        self._gomoku_board.hide()
+        # 五子棋棋盘：收到第一帧五子棋数据时才导入并创建
+        self._gomoku_board = None
+
+        # 上一帧的渲染结果，内容没变时跳过重新排版/重绘
+        self._last_json_text: str | None = None
+        # JSON 帧的廉价比对键：调用方给的帧号，或上一帧数据的快照
+        self._last_frame_key: tuple[Any, Any] | None = None
+        self._last_json_data: dict[str, Any] | None = None
+        self._last_board_key: tuple[tuple[int, ...], ...] | None = None
+        self._last_info_text = ""
 
         # 状态说明
         self._info = QLabel("")
@@ -42,7 +52,7 @@ class GameViewWidget(QFrame):
                 border: 1px solid {t.border_light};
                 border-radius: 16px;
             }}
-            QTextEdit {{
+            QPlainTextEdit {{
                 background: {t.bg_base};
                 color: {t.text_display};
                 border: none;
@@ -64,7 +74,6 @@ class GameViewWidget(QFrame):
             """
         )
         layout.addWidget(self._title)
-        layout.addWidget(self._gomoku_board, 0, alignment=Qt.AlignCenter)
         layout.addWidget(self._info)
         layout.addWidget(self._content, 1)
 
@@ -81,18 +90,60 @@ class GameViewWidget(QFrame):
     # ========== 渲染策略 ==========
     def _render_json(self, data: Dict[str, Any]):
         """默认 JSON 展示"""
-        self._gomoku_board.hide()
-        self._info.setText("")
+        if self._gomoku_board is not None:
+            self._gomoku_board.hide()
+        self._set_info("")
         self._content.show()
 
+        if self._is_same_json_frame(data):
+            return
+
         try:
             formatted = json.dumps(data, ensure_ascii=False, indent=2)
         except Exception:
             formatted = str(data)
-        self._content.setPlainText(formatted)
+        # 只保留开头 MAX_JSON_LINES 行，超大的渲染数据不会拖慢排版，顶层字段也不会被挤掉
+        lines = formatted.split("\n", self.MAX_JSON_LINES)
+        if len(lines) > self.MAX_JSON_LINES:
+            total = formatted.count("\n") + 1
+            lines[-1] = f"…（已截断，共 {total} 行）"
+            formatted = "\n".join(lines)
+        # 帧号变了但内容没变时，靠文本比对兜底，setPlainText 会整篇重新排版
+        if formatted != self._last_json_text:
+            self._last_json_text = formatted
+            self._content.setPlainText(formatted)
+
+    def _is_same_json_frame(self, data: dict[str, Any]) -> bool:
+        """在序列化之前判断是否与上一帧相同，相同则连 json.dumps 一起跳过"""
+        frame = data.get("frame_id", data.get("tick"))
+        if frame is not None:
+            # 调用方给了帧号：只比帧号
+            key = (data.get("game"), frame)
+            if key == self._last_frame_key:
+                return True
+            self._last_frame_key = key
+            self._last_json_data = None
+            return False
+
+        # 没有帧号：与上一帧的深拷贝快照做一次 ==（C 层递归比较，远比带缩进的 dumps 便宜），
+        # 快照不与调用方共享对象，原地修改的嵌套列表也能比出来
+        self._last_frame_key = None
+        if self._last_json_data is not None and data == self._last_json_data:
+            return True
+        try:
+            self._last_json_data = copy.deepcopy(data)
+        except Exception:
+            self._last_json_data = None
+        return False
 
     def _render_gomoku(self, data: Dict[str, Any]):
         """绘制五子棋棋盘"""
+        if self._gomoku_board is None:
+            from client.plugins.gomoku.widget import GomokuBoard
+            self._gomoku_board = GomokuBoard()
+            # 放在标题下方
+            self.layout().insertWidget(1, self._gomoku_board, 0, Qt.AlignCenter)
+
         self._content.hide()
         self._gomoku_board.show()
 
@@ -101,7 +152,21 @@ class GameViewWidget(QFrame):
         if not board:
             board = [[0] * size for _ in range(size)]
 
-        self._gomoku_board.set_board(board)
+        board_key = tuple(map(tuple, board))
+        prev_key = self._last_board_key
+        if board_key != prev_key:
+            self._last_board_key = board_key
+            changed = None
+            # 行数或任一行长度变了就整盘重绘，否则逐格比对上一帧，只重绘变化的格子
+            if prev_key is not None and list(map(len, prev_key)) == list(map(len, board_key)):
+                changed = [
+                    (r, c)
+                    for r, (old_row, new_row) in enumerate(zip(prev_key, board_key, strict=True))
+                    if old_row != new_row
+                    for c, (old, new) in enumerate(zip(old_row, new_row, strict=True))
+                    if old != new
+                ]
+            self._gomoku_board.set_board(board, changed)
 
         current_player = data.get("current_player", 1)
         if isinstance(current_player, str):
@@ -133,5 +198,11 @@ class GameViewWidget(QFrame):
         if last_move:
             status_parts.append(f"最后落子: {last_move[0]}, {last_move[1]}")
 
-        self._info.setText(" · ".join(status_parts))
+        self._set_info(" · ".join(status_parts))
+
+    def _set_info(self, text: str):
+        """状态说明不变时不重复设置，避免标签重新排版"""
+        if text != self._last_info_text:
+            self._last_info_text = text
+            self._info.setText(text)
 
@@ -1,13 +1,16 @@
 """
 大厅主界面组件 - 修复布局
 """
+from types import MappingProxyType
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFrame, QGraphicsDropShadowEffect,
-    QScrollArea
+    QPushButton, QFrame, QSizePolicy
+)
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker, QPointF, QRectF, QSize
+from PySide6.QtGui import (
+    QColor, QFont, QGuiApplication, QIcon, QPainter, QPixmap, QRadialGradient
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QColor
 
 from .game_card import GameCard
 from .friends_widget import FriendsWidget
@@ -17,6 +20,214 @@ from .game_view import GameViewWidget
 from ..styles.theme import CURRENT_THEME as t
 
 
+# 选择器都带 objectName，避免裸 QFrame 规则级联到面板内部的标签和列表
+_LOBBY_QSS = f"""
+    QWidget#profileBar {{
+        background-color: {t.bg_card};
+        border-bottom: 1px solid {t.border_light};
+    }}
+    QWidget#lobbyContent {{
+        background-color: {t.bg_base};
+    }}
+    QLabel#lobbyTitle {{
+        font-size: 18px;
+        font-weight: 700;
+        color: {t.text_display};
+    }}
+    QLabel#panelTitle {{
+        font-size: 16px;
+        font-weight: 700;
+        color: {t.text_display};
+    }}
+    QWidget#lobbyPanel {{
+        background-color: {t.bg_card};
+        border: 1px solid {t.border_light};
+        border-radius: 16px;
+    }}
+    QFrame#statusBar {{
+        background-color: {t.bg_card};
+        border-top: 1px solid {t.border_light};
+    }}
+    QLabel#versionLabel {{
+        font-size: 11px;
+        color: {t.text_caption};
+    }}
+    QLabel#connectionStatus {{
+        font-size: 11px;
+        color: {t.success};
+    }}
+    QLabel#connectionStatus[state="err"] {{
+        color: {t.error};
+    }}
+
+    /* 用户信息栏 */
+    QLabel#profileAvatar {{
+        background-color: {t.bg_base};
+        border-radius: 24px;
+        border: 2px solid white;
+    }}
+    QLabel#profileName {{
+        font-size: 16px;
+        font-weight: 700;
+        color: {t.text_display};
+    }}
+    QLabel#profileStatus {{
+        font-size: 12px;
+        color: {t.text_caption};
+    }}
+    QWidget#coinsPill {{
+        background-color: {t.primary_bg};
+        border-radius: 18px;
+    }}
+    QWidget#coinsPill:hover {{
+        background-color: #DBEAFE;
+    }}
+    QLabel#coinIcon {{
+        padding: 0 16px;
+    }}
+    QLabel#coinsLabel {{
+        font-size: 14px;
+        font-weight: 700;
+        color: {t.primary};
+        padding: 0 16px;
+    }}
+    QPushButton#profileIconBtn {{
+        background-color: white;
+        border: 1px solid {t.border_light};
+        border-radius: 20px;
+        padding: 0;
+    }}
+    QPushButton#profileIconBtn:hover {{
+        border-color: {t.primary};
+        background-color: {t.bg_hover};
+    }}
+"""
+
+
+# 大厅展示的游戏（顺序即卡片顺序）
+GAME_IDS = ('gomoku', 'shooter2d', 'werewolf', 'monopoly', 'racing')
+
+
+# 演示数据：字面量常量，导入时构建一次，每次进入大厅直接复用
+_DEMO_USER = MappingProxyType({'nickname': '玩家小明', 'avatar': '😎', 'coins': 1680})
+
+_DEMO_FRIENDS = tuple(MappingProxyType(f) for f in (
+    {'user_id': '1', 'nickname': '游戏达人', 'avatar': '🎮', 'is_online': True, 'in_game': True, 'current_game': '五子棋'},
+    {'user_id': '2', 'nickname': '神枪手', 'avatar': '🔫', 'is_online': True},
+    {'user_id': '3', 'nickname': '策略大师', 'avatar': '🧠', 'is_online': True},
+    {'user_id': '4', 'nickname': '速度之王', 'avatar': '🏎️', 'is_online': False},
+    {'user_id': '5', 'nickname': '休闲玩家', 'avatar': '☕', 'is_online': False},
+))
+
+_DEMO_ROOMS = tuple(MappingProxyType(r) for r in (
+    {'room_id': '1001', 'name': '新手友好局', 'game_type': 'gomoku', 'current_players': 1, 'max_players': 2, 'host_name': '小白'},
+    {'room_id': '1002', 'name': '激烈对战', 'game_type': 'shooter2d', 'current_players': 5, 'max_players': 8, 'host_name': '枪神'},
+    {'room_id': '1003', 'name': '狼人杀欢乐局', 'game_type': 'werewolf', 'current_players': 8, 'max_players': 12, 'host_name': '预言家'},
+    {'room_id': '1004', 'name': '大富翁挑战', 'game_type': 'monopoly', 'current_players': 3, 'max_players': 4, 'host_name': '富豪'},
+    {'room_id': '1005', 'name': '极速漂移', 'game_type': 'racing', 'current_players': 4, 'max_players': 6, 'host_name': '车神', 'is_playing': True},
+))
+
+_DEMO_CHAT = tuple(MappingProxyType(m) for m in (
+    {
+        'sender_id': '1',
+        'sender_name': '游戏达人',
+        'sender_color': '#10B981',
+        'content': '大家好！有人一起玩五子棋吗？',
+        'time': '14:30'
+    },
+    {
+        'sender_id': '2',
+        'sender_name': '神枪手',
+        'sender_color': '#EF4444',
+        'content': '我要开一局射击，来吗？',
+        'time': '14:31'
+    },
+))
+
+_DEMO_RENDER_STATE = MappingProxyType({
+    "game": "gomoku",
+    "board_size": 15,
+    "current_player": "black",
+    "last_move": [7, 7],
+    "history_count": 12,
+    "status": "等待开始（演示数据）"
+})
+
+
+AVATAR_SIZE = 48
+
+# (字符, 字号, 边长, 颜色) -> 预先绘制好的位图
+_EMOJI_PIXMAP_CACHE: dict[tuple[str, int, int, str], QPixmap] = {}
+
+
+def _emoji_pixmap(text: str, font_px: int, size: int, color: str = t.text_body) -> QPixmap:
+    """把 emoji/符号绘制成 size×size 的位图并缓存，标签和按钮只需贴图"""
+    key = (text, font_px, size, color)
+    pixmap = _EMOJI_PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        ratio = QGuiApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        font = QFont()
+        font.setPixelSize(font_px)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(0, 0, size, size, Qt.AlignCenter, text)
+        painter.end()
+        _EMOJI_PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+def _render_avatar(emoji: str) -> QPixmap:
+    """头像位图"""
+    return _emoji_pixmap(emoji, 24, AVATAR_SIZE)
+
+
+# 用户信息栏的在线状态：绿色圆点 + 文字
+_ONLINE_STATUS_HTML = (
+    f'<span style="color: {t.success}; font-size: 10px;">●</span>&nbsp;在线'
+)
+
+
+def _plain_label(text: str = "") -> QLabel:
+    """纯文本标签：跳过 AutoText 每次 setText 时的富文本检测"""
+    label = QLabel(text)
+    label.setTextFormat(Qt.PlainText)
+    return label
+
+
+_AVATAR_SHADOW = None
+
+
+def _avatar_shadow() -> QPixmap:
+    """头像下方的柔和阴影（向下偏移 2px），只绘制一次，垫在头像标签下面"""
+    global _AVATAR_SHADOW
+    if _AVATAR_SHADOW is None:
+        size = AVATAR_SIZE
+        blur, offset, alpha = 10, 2, 20
+        ratio = QGuiApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        radius = size / 2
+        outer = radius + blur / 2
+        inner = radius - blur / 2
+        gradient = QRadialGradient(QPointF(radius, radius + offset), outer)
+        gradient.setColorAt(0, QColor(0, 0, 0, alpha))
+        gradient.setColorAt(inner / outer, QColor(0, 0, 0, alpha))
+        gradient.setColorAt(1, QColor(0, 0, 0, 0))
+
+        painter = QPainter(pixmap)
+        painter.fillRect(QRectF(0, 0, size, size), gradient)
+        painter.end()
+        _AVATAR_SHADOW = pixmap
+    return _AVATAR_SHADOW
+
+
 class UserProfileBar(QWidget):
     """用户信息栏"""
     
@@ -25,6 +236,8 @@ class UserProfileBar(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 上一次显示的 (昵称, 金币, 头像)，服务端重复推送相同资料时直接跳过
+        self._shown_user = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -34,24 +247,18 @@ class UserProfileBar(QWidget):
         
         # 头像 - 固定尺寸
         avatar_container = QWidget()
-        avatar_container.setFixedSize(48, 48)
+        avatar_container.setFixedSize(AVATAR_SIZE, AVATAR_SIZE)
+
+        # 阴影预先画成位图垫在头像下面，不用 QGraphicsEffect（每次重绘都要离屏模糊）
+        shadow_label = QLabel(avatar_container)
+        shadow_label.setGeometry(0, 0, AVATAR_SIZE, AVATAR_SIZE)
+        shadow_label.setPixmap(_avatar_shadow())
         
-        self.avatar_label = QLabel("👤", avatar_container)
-        self.avatar_label.setGeometry(0, 0, 48, 48)
+        self.avatar_label = QLabel(avatar_container)
+        self.avatar_label.setGeometry(0, 0, AVATAR_SIZE, AVATAR_SIZE)
         self.avatar_label.setAlignment(Qt.AlignCenter)
-        self.avatar_label.setStyleSheet(f"""
-            background-color: {t.bg_base};
-            border-radius: 24px;
-            font-size: 24px;
-            border: 2px solid white;
-        """)
-        
-        # 阴影
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setOffset(0, 2)
-        shadow.setColor(QColor(0, 0, 0, 20))
-        self.avatar_label.setGraphicsEffect(shadow)
+        self.avatar_label.setPixmap(_render_avatar("👤"))
+        self.avatar_label.setObjectName("profileAvatar")
         
         layout.addWidget(avatar_container)
         
@@ -60,28 +267,15 @@ class UserProfileBar(QWidget):
         info_layout.setSpacing(4)
         info_layout.setAlignment(Qt.AlignVCenter)
         
-        self.name_label = QLabel("游客用户")
-        self.name_label.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 700;
-            color: {t.text_display};
-        """)
+        self.name_label = _plain_label("游客用户")
+        self.name_label.setObjectName("profileName")
         info_layout.addWidget(self.name_label)
         
-        # 状态
-        status_layout = QHBoxLayout()
-        status_layout.setSpacing(4)
-        
-        status_dot = QLabel("●")
-        status_dot.setStyleSheet(f"color: {t.success}; font-size: 10px;")
-        status_layout.addWidget(status_dot)
-        
-        self.status_label = QLabel("在线")
-        self.status_label.setStyleSheet(f"font-size: 12px; color: {t.text_caption};")
-        status_layout.addWidget(self.status_label)
-        
-        status_layout.addStretch()
-        info_layout.addLayout(status_layout)
+        # 状态：圆点和文字合成一个富文本标签，省掉一层布局和一个控件
+        self.status_label = QLabel(_ONLINE_STATUS_HTML)
+        self.status_label.setTextFormat(Qt.RichText)
+        self.status_label.setObjectName("profileStatus")
+        info_layout.addWidget(self.status_label)
         
         layout.addLayout(info_layout)
         layout.addStretch()
@@ -90,31 +284,19 @@ class UserProfileBar(QWidget):
         coins_widget = QWidget()
         coins_widget.setFixedHeight(36)
         coins_widget.setCursor(Qt.PointingHandCursor)
-        coins_widget.setStyleSheet(f"""
-            QWidget {{
-                background-color: {t.primary_bg};
-                border-radius: 18px;
-                padding: 0 16px;
-            }}
-            QWidget:hover {{
-                background-color: #DBEAFE;
-            }}
-        """)
+        coins_widget.setObjectName("coinsPill")
         
         coins_layout = QHBoxLayout(coins_widget)
         coins_layout.setContentsMargins(16, 0, 16, 0)
         coins_layout.setSpacing(8)
         
-        coin_icon = QLabel("💎")
-        coin_icon.setStyleSheet("font-size: 16px;")
+        coin_icon = QLabel()
+        coin_icon.setPixmap(_emoji_pixmap("💎", 16, 20))
+        coin_icon.setObjectName("coinIcon")
         coins_layout.addWidget(coin_icon)
         
-        self.coins_label = QLabel("0")
-        self.coins_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 700;
-            color: {t.primary};
-        """)
+        self.coins_label = _plain_label("0")
+        self.coins_label.setObjectName("coinsLabel")
         coins_layout.addWidget(self.coins_label)
         
         layout.addWidget(coins_widget)
@@ -130,29 +312,29 @@ class UserProfileBar(QWidget):
         layout.addWidget(logout_btn)
     
     def _create_icon_btn(self, icon: str, tooltip: str) -> QPushButton:
-        btn = QPushButton(icon)
+        btn = QPushButton()
+        btn.setIcon(QIcon(_emoji_pixmap(icon, 16, 20)))
+        btn.setIconSize(QSize(20, 20))
         btn.setFixedSize(40, 40)
         btn.setCursor(Qt.PointingHandCursor)
         btn.setToolTip(tooltip)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: white;
-                border: 1px solid {t.border_light};
-                border-radius: 20px;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                border-color: {t.primary};
-                background-color: {t.bg_hover};
-            }}
-        """)
+        btn.setObjectName("profileIconBtn")
         return btn
     
     def set_user(self, user_data: dict):
-        self.name_label.setText(user_data.get('nickname', '游客'))
-        self.coins_label.setText(str(user_data.get('coins', 0)))
-        if user_data.get('avatar'):
-            self.avatar_label.setText(user_data['avatar'])
+        get = user_data.get
+        nickname, coins, avatar = get('nickname', '游客'), get('coins', 0), get('avatar')
+        shown = self._shown_user
+        if shown == (nickname, coins, avatar):
+            return
+
+        if shown is None or shown[0] != nickname:
+            self.name_label.setText(nickname)
+        if shown is None or shown[1] != coins:
+            self.coins_label.setText(str(coins))
+        if avatar and (shown is None or shown[2] != avatar):
+            self.avatar_label.setPixmap(_render_avatar(avatar))
+        self._shown_user = (nickname, coins, avatar)
 
 
 class LobbyWidget(QWidget):
@@ -164,28 +346,34 @@ class LobbyWidget(QWidget):
     quick_match_requested = Signal()
     logout_requested = Signal()
     
+    GAME_CARD_SPACING = 16
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 当前显示的连接状态 (connected, text)，与状态栏初始文字一致
+        self._conn_state = (True, "")
+        self._deferred_done = False
         self.setup_ui()
-        self.load_demo_data()
     
     def setup_ui(self):
+        # 大厅各区块（含用户信息栏）的样式统一挂在这里，子控件只设 objectName
+        self.setStyleSheet(_LOBBY_QSS)
+
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
         # 顶部栏
         self.profile_bar = UserProfileBar()
-        self.profile_bar.setStyleSheet(f"""
-            background-color: {t.bg_card};
-            border-bottom: 1px solid {t.border_light};
-        """)
+        self.profile_bar.setObjectName("profileBar")
+        # 自定义 QWidget 子类需要开启该属性，样式表背景/边框才会绘制
+        self.profile_bar.setAttribute(Qt.WA_StyledBackground, True)
         self.profile_bar.logout_clicked.connect(self.logout_requested.emit)
         main_layout.addWidget(self.profile_bar)
         
         # 内容区
         content = QWidget()
-        content.setStyleSheet(f"background-color: {t.bg_base};")
+        content.setObjectName("lobbyContent")
         content_layout = QHBoxLayout(content)
         content_layout.setContentsMargins(32, 24, 32, 24)
         content_layout.setSpacing(24)
@@ -197,76 +385,49 @@ class LobbyWidget(QWidget):
         left_layout.setSpacing(20)
         
         # 游戏选择标题
-        games_title = QLabel("开始游戏")
-        games_title.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 700;
-            color: {t.text_display};
-        """)
+        games_title = _plain_label("开始游戏")
+        games_title.setObjectName("lobbyTitle")
         left_layout.addWidget(games_title)
         
-        # 游戏卡片 - 水平滚动区域
-        games_scroll = QScrollArea()
-        games_scroll.setWidgetResizable(True)
-        games_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        games_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        games_scroll.setFixedHeight(240)
-        games_scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
-        
-        games_container = QWidget()
-        games_grid = QHBoxLayout(games_container)
-        games_grid.setContentsMargins(0, 0, 0, 0)
-        games_grid.setSpacing(16)
-        
-        game_ids = ['gomoku', 'shooter2d', 'werewolf', 'monopoly', 'racing']
-        for game_id in game_ids:
-            card = GameCard(game_id)
+        # 游戏卡片行：滚动条本来就关闭，不需要 QScrollArea，直接用一个容器。
+        # 卡片是定宽的，按固定步长摆放即可，不需要布局；宽度策略设为 Ignored，
+        # 面板窄时右侧卡片被裁掉而不是撑宽整个面板
+        games_row = QWidget()
+        games_row.setFixedHeight(240)
+        games_row.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Fixed)
+
+        for col, game_id in enumerate(GAME_IDS):
+            card = GameCard(game_id, games_row)
+            card.move(col * (card.width() + self.GAME_CARD_SPACING), 0)
             card.clicked.connect(self.game_selected.emit)
-            games_grid.addWidget(card)
         
-        games_grid.addStretch()
-        games_scroll.setWidget(games_container)
-        left_layout.addWidget(games_scroll)
+        left_layout.addWidget(games_row)
         
         # 房间列表（卡片容器）
-        rooms_card = QFrame()
-        rooms_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {t.bg_card};
-                border: 1px solid {t.border_light};
-                border-radius: 16px;
-            }}
-        """)
-        rooms_inner = QVBoxLayout(rooms_card)
-        rooms_inner.setContentsMargins(20, 20, 20, 20)
-        
-        self.rooms_widget = RoomsWidget()
+        self.rooms_widget = self._as_panel(RoomsWidget(), 20)
         self.rooms_widget.join_room.connect(self.room_joined.emit)
         self.rooms_widget.create_room.connect(self.room_created.emit)
         self.rooms_widget.quick_match.connect(self.quick_match_requested.emit)
-        rooms_inner.addWidget(self.rooms_widget)
         
-        left_layout.addWidget(rooms_card, 1)
+        left_layout.addWidget(self.rooms_widget, 1)
         
         # 中间：游戏画面（可嵌入渲染，当前显示 render 数据）
         game_panel = QFrame()
-        game_panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {t.bg_card};
-                border: 1px solid {t.border_light};
-                border-radius: 16px;
-            }}
-        """)
+        game_panel.setObjectName("lobbyPanel")
         game_layout = QVBoxLayout(game_panel)
         game_layout.setContentsMargins(16, 16, 16, 16)
         game_layout.setSpacing(12)
         
-        game_title = QLabel("游戏画面")
-        game_title.setStyleSheet(f"font-size: 16px; font-weight: 700; color: {t.text_display};")
+        game_title = _plain_label("游戏画面")
+        game_title.setObjectName("panelTitle")
         game_layout.addWidget(game_title)
         
-        self.game_view = GameViewWidget()
-        game_layout.addWidget(self.game_view, 1)
+        # 游戏画面组件同样延后创建，先用空占位撑住布局
+        self._game_layout = game_layout
+        self._game_stub = QWidget()
+        game_layout.addWidget(self._game_stub, 1)
+        self.game_view = None
+        self._pending_render = None
         
         content_layout.addWidget(left_panel, 1)
         content_layout.addWidget(game_panel, 1)
@@ -278,39 +439,15 @@ class LobbyWidget(QWidget):
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.setSpacing(20)
         
-        # 好友卡片
-        friends_card = QFrame()
-        friends_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {t.bg_card};
-                border: 1px solid {t.border_light};
-                border-radius: 16px;
-            }}
-        """)
-        friends_inner = QVBoxLayout(friends_card)
-        friends_inner.setContentsMargins(16, 16, 16, 16)
-        
-        self.friends_widget = FriendsWidget()
-        friends_inner.addWidget(self.friends_widget)
-        
-        right_layout.addWidget(friends_card, 1)
-        
-        # 聊天卡片
-        chat_card = QFrame()
-        chat_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {t.bg_card};
-                border: 1px solid {t.border_light};
-                border-radius: 16px;
-            }}
-        """)
-        chat_inner = QVBoxLayout(chat_card)
-        chat_inner.setContentsMargins(16, 16, 16, 16)
-        
-        self.chat_widget = ChatWidget()
-        chat_inner.addWidget(self.chat_widget)
-        
-        right_layout.addWidget(chat_card, 1)
+        # 好友/聊天组件较重，先放空卡片占位，等首帧显示后再创建并替换
+        self._right_layout = right_layout
+        self._friends_stub = self._as_panel(QFrame())
+        right_layout.addWidget(self._friends_stub, 1)
+        self.friends_widget = None
+
+        self._chat_stub = self._as_panel(QFrame())
+        right_layout.addWidget(self._chat_stub, 1)
+        self.chat_widget = None
         
         content_layout.addWidget(right_panel)
         
@@ -319,95 +456,121 @@ class LobbyWidget(QWidget):
         # 底部状态栏
         self._setup_status_bar(main_layout)
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 第一次显示后，下一轮事件循环再依次创建游戏画面、右侧面板并填充演示数据，
+        # 大厅骨架先画出来；从未显示过的大厅不会构建这些重组件
+        if not self._deferred_done:
+            self._deferred_done = True
+            QTimer.singleShot(0, self._ensure_game_view)
+            QTimer.singleShot(0, self._populate_right_panel)
+            QTimer.singleShot(0, self.load_demo_data)
+
+    @staticmethod
+    def _as_panel(widget: QWidget, margin: int = 16) -> QWidget:
+        """把组件本身当作面板卡片：套用 lobbyPanel 样式并在其布局内留边距，
+        省掉外层 QFrame 和一层布局"""
+        widget.setObjectName("lobbyPanel")
+        # 自定义 QWidget 子类需要开启该属性，样式表背景/边框才会绘制
+        widget.setAttribute(Qt.WA_StyledBackground, True)
+        if widget.layout() is not None:
+            widget.layout().setContentsMargins(margin, margin, margin, margin)
+        return widget
+
+    def _ensure_game_view(self) -> GameViewWidget:
+        """首次调用时创建游戏画面组件，替换占位并补上期间收到的渲染数据"""
+        if self.game_view is None:
+            self.game_view = GameViewWidget()
+            self._game_layout.replaceWidget(self._game_stub, self.game_view)
+            self._game_stub.deleteLater()
+            self._game_stub = None
+            if self._pending_render is not None:
+                self.game_view.set_render_data(*self._pending_render)
+                self._pending_render = None
+        return self.game_view
+
+    def _populate_right_panel(self):
+        """创建好友、聊天组件并填充演示数据"""
+        if self.friends_widget is not None:
+            return
+        self.friends_widget = self._as_panel(FriendsWidget())
+        self._right_layout.replaceWidget(self._friends_stub, self.friends_widget)
+        self._friends_stub.deleteLater()
+        self._friends_stub = None
+
+        self.chat_widget = self._as_panel(ChatWidget())
+        self._right_layout.replaceWidget(self._chat_stub, self.chat_widget)
+        self._chat_stub.deleteLater()
+        self._chat_stub = None
+
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.friends_widget), QSignalBlocker(self.chat_widget):
+                self.friends_widget.set_friends(list(_DEMO_FRIENDS))
+                self.chat_widget.set_local_user('self')
+                for msg in _DEMO_CHAT:
+                    self.chat_widget.add_message(msg)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def _setup_status_bar(self, layout):
         status_bar = QFrame()
         status_bar.setFixedHeight(32)
-        status_bar.setStyleSheet(f"""
-            background-color: {t.bg_card};
-            border-top: 1px solid {t.border_light};
-        """)
+        status_bar.setObjectName("statusBar")
         
         status_layout = QHBoxLayout(status_bar)
         status_layout.setContentsMargins(32, 0, 32, 0)
         
-        self.connection_status = QLabel("🟢 已连接服务器")
-        self.connection_status.setStyleSheet(f"""
-            font-size: 11px;
-            color: {t.success};
-        """)
+        self.connection_status = _plain_label("🟢 已连接服务器")
+        self.connection_status.setObjectName("connectionStatus")
+        self.connection_status.setProperty("state", "ok")
         status_layout.addWidget(self.connection_status)
         
         status_layout.addStretch()
         
-        version = QLabel("Aether Party v0.1.0")
-        version.setStyleSheet(f"""
-            font-size: 11px;
-            color: {t.text_caption};
-        """)
+        version = _plain_label("Aether Party v0.1.0")
+        version.setObjectName("versionLabel")
         status_layout.addWidget(version)
         
         layout.addWidget(status_bar)
     
     def load_demo_data(self):
-        """加载演示数据"""
-        self.profile_bar.set_user({
-            'nickname': '玩家小明',
-            'avatar': '😎',
-            'coins': 1680
-        })
-        
-        self.friends_widget.set_friends([
-            {'user_id': '1', 'nickname': '游戏达人', 'avatar': '🎮', 'is_online': True, 'in_game': True, 'current_game': '五子棋'},
-            {'user_id': '2', 'nickname': '神枪手', 'avatar': '🔫', 'is_online': True},
-            {'user_id': '3', 'nickname': '策略大师', 'avatar': '🧠', 'is_online': True},
-            {'user_id': '4', 'nickname': '速度之王', 'avatar': '🏎️', 'is_online': False},
-            {'user_id': '5', 'nickname': '休闲玩家', 'avatar': '☕', 'is_online': False},
-        ])
-        
-        self.rooms_widget.set_rooms([
-            {'room_id': '1001', 'name': '新手友好局', 'game_type': 'gomoku', 'current_players': 1, 'max_players': 2, 'host_name': '小白'},
-            {'room_id': '1002', 'name': '激烈对战', 'game_type': 'shooter2d', 'current_players': 5, 'max_players': 8, 'host_name': '枪神'},
-            {'room_id': '1003', 'name': '狼人杀欢乐局', 'game_type': 'werewolf', 'current_players': 8, 'max_players': 12, 'host_name': '预言家'},
-            {'room_id': '1004', 'name': '大富翁挑战', 'game_type': 'monopoly', 'current_players': 3, 'max_players': 4, 'host_name': '富豪'},
-            {'room_id': '1005', 'name': '极速漂移', 'game_type': 'racing', 'current_players': 4, 'max_players': 6, 'host_name': '车神', 'is_playing': True},
-        ])
-        
-        self.chat_widget.set_local_user('self')
-        self.chat_widget.add_message({
-            'sender_id': '1',
-            'sender_name': '游戏达人',
-            'sender_color': '#10B981',
-            'content': '大家好！有人一起玩五子棋吗？',
-            'time': '14:30'
-        })
-        self.chat_widget.add_message({
-            'sender_id': '2',
-            'sender_name': '神枪手',
-            'sender_color': '#EF4444',
-            'content': '我要开一局射击，来吗？',
-            'time': '14:31'
-        })
-        
-        # 演示：填充一个示例渲染数据
-        demo_state = {
-            "game": "gomoku",
-            "board_size": 15,
-            "current_player": "black",
-            "last_move": [7, 7],
-            "history_count": 12,
-            "status": "等待开始（演示数据）"
-        }
-        self.set_game_render_data("演示：五子棋", demo_state)
+        """加载演示数据（好友/聊天的演示数据在 _populate_right_panel 中填充）"""
+        # 批量填充期间暂停重绘并屏蔽子组件信号，结束后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.profile_bar), QSignalBlocker(self.rooms_widget):
+                self.profile_bar.set_user(_DEMO_USER)
+                self.rooms_widget.set_rooms(list(_DEMO_ROOMS))
+
+                # 演示：填充一个示例渲染数据
+                self.set_game_render_data("演示：五子棋", dict(_DEMO_RENDER_STATE))
+        finally:
+            self.setUpdatesEnabled(True)
     
     def set_connection_status(self, connected: bool, text: str = ""):
+        # 心跳重复上报同样的状态时什么都不做
+        state = (connected, text)
+        if state == self._conn_state:
+            return
+        was_connected = self._conn_state[0]
+        self._conn_state = state
+
+        label = self.connection_status
         if connected:
-            self.connection_status.setText(f"🟢 {text or '已连接服务器'}")
-            self.connection_status.setStyleSheet(f"font-size: 11px; color: {t.success};")
+            label.setText(f"🟢 {text or '已连接服务器'}")
         else:
-            self.connection_status.setText(f"🔴 {text or '连接断开'}")
-            self.connection_status.setStyleSheet(f"font-size: 11px; color: {t.error};")
+            label.setText(f"🔴 {text or '连接断开'}")
+        if connected != was_connected:
+            # 只切换动态属性，复用已解析的样式规则
+            label.setProperty("state", "ok" if connected else "err")
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     def set_game_render_data(self, title: str, data: dict):
         """更新游戏画面展示（接收插件 render 输出）"""
-        if hasattr(self, "game_view"):
+        if self.game_view is None:
+            # 组件尚未创建：只保留最新一帧，创建后再渲染
+            self._pending_render = (title, data)
+        else:
             self.game_view.set_render_data(title, data)
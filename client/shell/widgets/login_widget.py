@@ -13,20 +13,129 @@ from ..utils.animation import AnimationUtils
 from ..styles.theme import CURRENT_THEME as t
 
 
+# 快速登录按钮：(文字, 样式名, 悬停色)
+_QUICK_LOGIN_BTNS = (
+    ("游客", "guest", "#6366F1"),
+    ("QQ", "qq", "#0EA5E9"),
+    ("微信", "wechat", "#10B981"),
+)
+
+# 登录页各控件的样式统一挂在 LoginWidget 上，子控件只设 objectName / 动态属性
+_LOGIN_QSS = f"""
+    QLabel#loginTitle {{
+        font-size: 36px;
+        font-weight: 800;
+        color: {t.text_display};
+        letter-spacing: -1px;
+    }}
+    QLabel#loginSubtitle {{
+        font-size: 14px;
+        color: {t.text_caption};
+        letter-spacing: 2px;
+    }}
+    QCheckBox#rememberCheck {{
+        color: {t.text_caption};
+        font-size: 13px;
+    }}
+    QPushButton#forgotBtn {{
+        background: transparent;
+        border: none;
+        color: {t.primary};
+        font-size: 13px;
+        padding: 0;
+    }}
+    QPushButton#forgotBtn:hover {{
+        color: {t.primary_hover};
+        text-decoration: underline;
+    }}
+    QPushButton#loginPrimary {{
+        background-color: {t.primary};
+        color: white;
+        border: none;
+        border-radius: 12px;
+        font-size: 16px;
+        font-weight: 700;
+    }}
+    QPushButton#loginPrimary:hover {{
+        background-color: {t.primary_hover};
+    }}
+    QPushButton#loginPrimary:pressed {{
+        background-color: {t.primary_pressed};
+    }}
+    QFrame#loginDivider {{
+        background-color: {t.border_normal};
+        max-height: 1px;
+        border: none;
+    }}
+    QLabel#loginOr {{
+        color: {t.text_caption};
+        font-size: 12px;
+    }}
+    QPushButton#quickLogin {{
+        background-color: white;
+        border: 1px solid {t.border_normal};
+        border-radius: 8px;
+        color: {t.text_body};
+        font-size: 13px;
+        font-weight: 500;
+    }}
+    QPushButton#quickLogin:hover {{
+        background-color: {t.bg_hover};
+    }}
+""" + "".join(f"""
+    QPushButton#quickLogin[provider="{name}"]:hover {{
+        border-color: {color};
+        color: {color};
+    }}""" for _, name, color in _QUICK_LOGIN_BTNS) + f"""
+    QLabel#registerHint {{
+        color: {t.text_caption};
+        font-size: 13px;
+    }}
+    QPushButton#registerBtn {{
+        background: transparent;
+        border: none;
+        color: {t.primary};
+        font-size: 13px;
+        font-weight: 600;
+        padding: 0 4px;
+    }}
+    QPushButton#registerBtn:hover {{
+        color: {t.primary_hover};
+    }}
+"""
+
+# 登录卡片阴影色（效果对象不能跨控件共享，颜色可以）
+_CARD_SHADOW_COLOR = QColor(0, 0, 0, 30)
+
+# 输入为空时的错误样式
+_INPUT_ERROR_QSS = f"border: 2px solid {t.error}; background-color: #FEF2F2;"
+
+
 class LoginWidget(QWidget):
     """登录界面"""
     
     login_requested = Signal(str, str, bool)
     register_requested = Signal()
     
+    SHAKE_RESET_MS = 1000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
         
+        # 错误高亮的输入框统一由一个定时器复原，连续点击只会重新计时
+        self._shaken = []
+        self._shake_timer = QTimer(self)
+        self._shake_timer.setSingleShot(True)
+        self._shake_timer.setInterval(self.SHAKE_RESET_MS)
+        self._shake_timer.timeout.connect(self._reset_shake)
+
         # 延迟入场动画，确保窗口已显示
         QTimer.singleShot(100, lambda: AnimationUtils.slide_in_up(self.card, 500, 30))
     
     def setup_ui(self):
+        self.setStyleSheet(_LOGIN_QSS)
+
         # 主布局 - 垂直居中
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -41,7 +150,7 @@ class LoginWidget(QWidget):
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(40)
         shadow.setOffset(0, 20)
-        shadow.setColor(QColor(0, 0, 0, 30))
+        shadow.setColor(_CARD_SHADOW_COLOR)
         self.card.setGraphicsEffect(shadow)
         
         # 卡片内容
@@ -55,21 +164,12 @@ class LoginWidget(QWidget):
         
         title = QLabel("Aether Party")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(f"""
-            font-size: 36px;
-            font-weight: 800;
-            color: {t.text_display};
-            letter-spacing: -1px;
-        """)
+        title.setObjectName("loginTitle")
         logo_layout.addWidget(title)
         
         subtitle = QLabel("跨平台好友对战大厅")
         subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet(f"""
-            font-size: 14px;
-            color: {t.text_caption};
-            letter-spacing: 2px;
-        """)
+        subtitle.setObjectName("loginSubtitle")
         logo_layout.addWidget(subtitle)
         
         card_layout.addLayout(logo_layout)
@@ -92,26 +192,14 @@ class LoginWidget(QWidget):
         options_layout = QHBoxLayout()
         
         self.remember_check = QCheckBox("记住我")
-        self.remember_check.setStyleSheet(f"color: {t.text_caption}; font-size: 13px;")
+        self.remember_check.setObjectName("rememberCheck")
         options_layout.addWidget(self.remember_check)
         
         options_layout.addStretch()
         
         forgot_btn = QPushButton("忘记密码?")
         forgot_btn.setCursor(Qt.PointingHandCursor)
-        forgot_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                color: {t.primary};
-                font-size: 13px;
-                padding: 0;
-            }}
-            QPushButton:hover {{
-                color: {t.primary_hover};
-                text-decoration: underline;
-            }}
-        """)
+        forgot_btn.setObjectName("forgotBtn")
         options_layout.addWidget(forgot_btn)
         
         card_layout.addLayout(options_layout)
@@ -121,22 +209,7 @@ class LoginWidget(QWidget):
         self.login_btn = QPushButton("进入游戏")
         self.login_btn.setFixedHeight(52)
         self.login_btn.setCursor(Qt.PointingHandCursor)
-        self.login_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {t.primary};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 16px;
-                font-weight: 700;
-            }}
-            QPushButton:hover {{
-                background-color: {t.primary_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {t.primary_pressed};
-            }}
-        """)
+        self.login_btn.setObjectName("loginPrimary")
         self.login_btn.clicked.connect(self._on_login)
         card_layout.addWidget(self.login_btn)
         
@@ -146,15 +219,15 @@ class LoginWidget(QWidget):
         
         line1 = QFrame()
         line1.setFrameShape(QFrame.HLine)
-        line1.setStyleSheet(f"background-color: {t.border_normal}; max-height: 1px; border: none;")
+        line1.setObjectName("loginDivider")
         
         or_label = QLabel("或是")
-        or_label.setStyleSheet(f"color: {t.text_caption}; font-size: 12px;")
+        or_label.setObjectName("loginOr")
         or_label.setAlignment(Qt.AlignCenter)
         
         line2 = QFrame()
         line2.setFrameShape(QFrame.HLine)
-        line2.setStyleSheet(f"background-color: {t.border_normal}; max-height: 1px; border: none;")
+        line2.setObjectName("loginDivider")
         
         divider_layout.addWidget(line1, 1)
         divider_layout.addWidget(or_label)
@@ -166,25 +239,12 @@ class LoginWidget(QWidget):
         quick_layout = QHBoxLayout()
         quick_layout.setSpacing(12)
         
-        for text, color in [("游客", "#6366F1"), ("QQ", "#0EA5E9"), ("微信", "#10B981")]:
+        for text, provider, _ in _QUICK_LOGIN_BTNS:
             btn = QPushButton(text)
+            btn.setObjectName("quickLogin")
+            btn.setProperty("provider", provider)
             btn.setFixedHeight(40)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: white;
-                    border: 1px solid {t.border_normal};
-                    border-radius: 8px;
-                    color: {t.text_body};
-                    font-size: 13px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    border-color: {color};
-                    color: {color};
-                    background-color: {t.bg_hover};
-                }}
-            """)
             quick_layout.addWidget(btn)
         
         card_layout.addLayout(quick_layout)
@@ -196,24 +256,12 @@ class LoginWidget(QWidget):
         register_layout.setAlignment(Qt.AlignCenter)
         
         hint = QLabel("还没有账号?")
-        hint.setStyleSheet(f"color: {t.text_caption}; font-size: 13px;")
+        hint.setObjectName("registerHint")
         register_layout.addWidget(hint)
         
         register_btn = QPushButton("立即注册")
         register_btn.setCursor(Qt.PointingHandCursor)
-        register_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                color: {t.primary};
-                font-size: 13px;
-                font-weight: 600;
-                padding: 0 4px;
-            }}
-            QPushButton:hover {{
-                color: {t.primary_hover};
-            }}
-        """)
+        register_btn.setObjectName("registerBtn")
         register_btn.clicked.connect(self.register_requested.emit)
         register_layout.addWidget(register_btn)
         
@@ -232,15 +280,24 @@ class LoginWidget(QWidget):
     
     def _shake_input(self):
         """错误反馈"""
-        error_style = f"border: 2px solid {t.error}; background-color: #FEF2F2;"
-        
         if not self.username_input.text().strip():
-            self.username_input.setStyleSheet(error_style)
-            QTimer.singleShot(1000, lambda: self.username_input.setStyleSheet(""))
+            self._mark_error(self.username_input)
         
         if not self.password_input.text():
-            self.password_input.setStyleSheet(error_style)
-            QTimer.singleShot(1000, lambda: self.password_input.setStyleSheet(""))
+            self._mark_error(self.password_input)
+
+        self._shake_timer.start()
+
+    def _mark_error(self, line_edit: QLineEdit):
+        if line_edit not in self._shaken:
+            line_edit.setStyleSheet(_INPUT_ERROR_QSS)
+            self._shaken.append(line_edit)
+
+    def _reset_shake(self):
+        """复原所有被标红的输入框"""
+        for line_edit in self._shaken:
+            line_edit.setStyleSheet("")
+        self._shaken.clear()
     
     def set_loading(self, loading: bool):
         self.login_btn.setEnabled(not loading)
@@ -11,6 +11,7 @@ from typing import List, Dict, Any
 from datetime import datetime
 
 from ..styles.theme import CURRENT_THEME as t
+from ..utils.layout import clear_layout
 
 
 class NotificationItem(QWidget):
@@ -238,10 +239,7 @@ class NotificationCenter(QWidget):
         """清空所有通知"""
         self.notifications.clear()
         
-        while self.list_layout.count() > 1:
-            item = self.list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        clear_layout(self.list_layout, keep_tail=1)
         
         self._update_count()
     
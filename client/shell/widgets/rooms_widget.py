@@ -9,6 +9,7 @@ from PySide6.QtCore import Qt, Signal
 from typing import List, Dict, Any
 
 from ..styles.theme import CURRENT_THEME as t
+from ..utils.layout import clear_layout
 
 
 class RoomCard(QWidget):
@@ -272,10 +273,7 @@ class RoomsWidget(QWidget):
 
     def _refresh_list(self):
         # 清空
-        while self.rooms_layout.count() > 1:
-            item = self.rooms_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        clear_layout(self.rooms_layout, keep_tail=1)
         
         if not self.rooms_data:
             empty = QLabel("暂无房间\n快来创建吧！")
@@ -0,0 +1,17 @@
+"""
+测试公共夹具
+"""
+import os
+
+import pytest
+
+# 界面组件测试不需要真实显示器
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """整个测试会话共用一个 QApplication"""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
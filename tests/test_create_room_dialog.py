@@ -0,0 +1,110 @@
+"""
+创建房间对话框测试
+"""
+import pytest
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtTest import QTest
+
+from client.shell.widgets.create_room_dialog import CreateRoomDialog
+
+
+class TestCreateRoomDialog:
+    """游戏选择条与人数联动测试"""
+
+    @pytest.fixture
+    def dialog(self, qapp):
+        dialog = CreateRoomDialog()
+        dialog.show()
+        qapp.processEvents()
+        yield dialog
+        dialog.close()
+        dialog.deleteLater()
+
+    def _click_game(self, dialog, index):
+        picker = dialog.game_picker
+        QTest.mouseClick(picker, Qt.LeftButton, pos=picker._rects[index].center())
+
+    def test_click_cell_selects_game(self, dialog):
+        """点击格子发出 game_selected"""
+        selected = []
+        dialog.game_picker.game_selected.connect(selected.append)
+
+        self._click_game(dialog, 2)
+
+        assert selected == ["werewolf"]
+        assert dialog.game_picker.selected_game() == "werewolf"
+        assert dialog.selected_game == "werewolf"
+
+    def test_click_selected_cell_is_noop(self, dialog):
+        """点击已选中的格子不重复发信号"""
+        selected = []
+        dialog.game_picker.game_selected.connect(selected.append)
+
+        self._click_game(dialog, 0)
+
+        assert selected == []
+
+    def test_click_between_cells_is_noop(self, dialog):
+        """点在格子间隙不选中任何游戏"""
+        selected = []
+        dialog.game_picker.game_selected.connect(selected.append)
+        picker = dialog.game_picker
+
+        # 两个格子之间的间隙
+        gap = QPoint(picker._rects[0].right() + picker.CELL_SPACING // 2, picker.height() // 2)
+        QTest.mouseClick(picker, Qt.LeftButton, pos=gap)
+
+        assert selected == []
+
+    def test_players_clamped_to_new_game_max(self, dialog):
+        """切换到人数上限更小的游戏时，人数被压到新上限"""
+        self._click_game(dialog, 2)  # 狼人杀，上限 12
+        dialog.players_spin.setValue(10)
+
+        self._click_game(dialog, 3)  # 大富翁，上限 4
+
+        assert dialog.players_spin.maximum() == 4
+        assert dialog.players_spin.value() == 4
+
+    def test_value_changed_only_on_real_change(self, dialog):
+        """人数没有变化时不发 valueChanged，变化时只发一次最终值"""
+        values = []
+        dialog.players_spin.valueChanged.connect(values.append)
+
+        self._click_game(dialog, 2)  # 2 人 -> 上限 12，值不变
+        assert values == []
+
+        dialog.players_spin.setValue(10)
+        values.clear()
+
+        self._click_game(dialog, 3)  # 10 -> 4
+        assert values == [4]
+
+        self._click_game(dialog, 2)  # 上限放宽，值保持 4
+        assert values == [4]
+
+    def test_keyboard_selection(self, dialog):
+        """方向键/Home/End 切换游戏"""
+        picker = dialog.game_picker
+        selected = []
+        picker.game_selected.connect(selected.append)
+        picker.setFocus()
+
+        QTest.keyClick(picker, Qt.Key_Left)  # 已在最左，不动
+        QTest.keyClick(picker, Qt.Key_Right)
+        QTest.keyClick(picker, Qt.Key_End)
+        QTest.keyClick(picker, Qt.Key_Right)  # 已在最右，不动
+        QTest.keyClick(picker, Qt.Key_Home)
+
+        assert selected == ["shooter2d", "racing", "gomoku"]
+        assert dialog.selected_game == "gomoku"
+
+    def test_focus_and_accessibility(self, dialog):
+        picker = dialog.game_picker
+        assert picker.focusPolicy() == Qt.StrongFocus
+        assert picker.accessibleName() == "选择游戏"
+        assert "五子棋" in picker.accessibleDescription()
+
+        self._click_game(dialog, 3)
+
+        assert "大富翁" in picker.accessibleDescription()
@@ -0,0 +1,109 @@
+"""
+好友列表测试
+"""
+import pytest
+
+from client.shell.widgets.friends_widget import Friend, FriendSearchIndex, FriendsWidget
+
+
+def _friend(user_id, nickname):
+    return Friend(user_id=user_id, nickname=nickname)
+
+
+class TestFriendSearchIndex:
+    """昵称搜索索引测试"""
+
+    @pytest.fixture
+    def index(self):
+        return FriendSearchIndex([
+            _friend("1", "abab"),
+            _friend("2", "Alice"),
+            _friend("3", "游戏达人"),
+            _friend("4", "Bob"),
+        ])
+
+    def test_single_char_query(self, index):
+        """单字符查询走子串匹配"""
+        assert index.match("b") == {"1", "4"}
+        assert index.match("游") == {"3"}
+
+    def test_empty_query_matches_all(self, index):
+        assert index.match("") == {"1", "2", "3", "4"}
+
+    def test_case_folding(self, index):
+        """大小写不敏感"""
+        assert index.match("ALI") == {"2"}
+        assert index.match("bOb") == {"4"}
+
+    def test_bigrams_present_but_not_contiguous(self, index):
+        """'abb' 的二元组 ab、bb 中 bb 不在 abab 里；'aba' 的二元组都在且连续出现"""
+        assert index.match("abb") == set()
+        assert index.match("aba") == {"1"}
+
+    def test_all_bigrams_hit_but_no_substring(self):
+        """二元组全部命中但不连续时，最终子串核对会排除"""
+        index = FriendSearchIndex([_friend("1", "abxbc")])
+        # ab、bc 都在 abxbc 里，但 abc 不是子串
+        assert index.match("abc") == set()
+
+    def test_no_match(self, index):
+        assert index.match("zz") == set()
+        assert index.match("不存在") == set()
+
+
+class TestFriend:
+    """好友记录测试"""
+
+    def test_from_dict_defaults(self):
+        """缺失的字段取默认值"""
+        friend = Friend.from_dict({})
+        assert friend == Friend()
+        assert friend.user_id == ""
+        assert friend.nickname == "Unknown"
+        assert friend.avatar == "👤"
+        assert friend.is_online is False
+        assert friend.in_game is False
+        assert friend.current_game == "游戏中"
+
+    def test_from_dict_coerces_flags(self):
+        friend = Friend.from_dict({"user_id": "7", "is_online": 1, "in_game": 0})
+        assert friend.user_id == "7"
+        assert friend.is_online is True
+        assert friend.in_game is False
+
+
+class TestFriendsWidgetUpdate:
+    """好友局部更新测试"""
+
+    @pytest.fixture
+    def widget(self, qapp):
+        widget = FriendsWidget()
+        widget.set_friends([
+            {"user_id": "1", "nickname": "游戏达人", "is_online": True},
+            {"user_id": "2", "nickname": "神枪手"},
+        ])
+        yield widget
+        widget.deleteLater()
+
+    def test_update_known_friend(self, widget):
+        assert widget.update_friend("2", {"is_online": True}) is True
+        assert widget.friends_data[1].is_online is True
+
+    def test_update_unknown_id(self, widget):
+        """找不到好友时返回 False，数据不变"""
+        before = list(widget.friends_data)
+        assert widget.update_friend("404", {"is_online": True}) is False
+        assert widget.friends_data == before
+
+    def test_update_ignores_unknown_keys(self, widget):
+        """补丁里不属于 Friend 的字段被忽略"""
+        assert widget.update_friend("1", {"level": 99, "nickname": "新昵称"}) is True
+        friend = widget.friends_data[0]
+        assert friend.nickname == "新昵称"
+        assert not hasattr(friend, "level")
+
+    def test_nickname_update_rebuilds_search_index(self, widget):
+        assert widget._matching_ids("达人") == {"1"}
+        widget.update_friend("1", {"nickname": "新昵称"})
+        assert widget._matching_ids("达人") == set()
+        assert widget._matching_ids("昵称") == {"1"}
@@ -0,0 +1,170 @@
+"""
+游戏画面局部重绘测试
+"""
+import pytest
+
+from client.plugins.gomoku.widget import GomokuBoard
+from client.shell.widgets import game_view
+from client.shell.widgets.game_view import GameViewWidget
+
+
+def _empty_board(size=15):
+    return [[0] * size for _ in range(size)]
+
+
+def _record_updates(widget):
+    """把 widget.update(...) 的调用参数记下来，空元组表示整体重绘"""
+    calls = []
+    widget.update = lambda *args: calls.append(args)
+    return calls
+
+
+class TestGomokuBoardRepaint:
+    """棋盘按格子重绘测试"""
+
+    @pytest.fixture
+    def board(self, qapp):
+        board = GomokuBoard()
+        yield board
+        board.deleteLater()
+
+    def test_set_board_with_changed_updates_only_listed_cells(self, board):
+        calls = _record_updates(board)
+        grid = _empty_board()
+        grid[3][4] = 1
+        grid[7][7] = 2
+
+        board.set_board(grid, [(3, 4), (7, 7)])
+
+        assert board.board is grid
+        assert calls == [(board._cell_rect(3, 4),), (board._cell_rect(7, 7),)]
+
+    def test_set_board_without_changed_repaints_all(self, board):
+        calls = _record_updates(board)
+
+        board.set_board(_empty_board())
+
+        assert calls == [()]
+
+    def test_cell_rect_covers_stone(self, board):
+        """格子重绘区域要盖住整颗棋子"""
+        rect = board._cell_rect(7, 7)
+        x, y = board._board_to_pixel(7, 7)
+        assert rect.contains(x - 15, y - 15)
+        assert rect.contains(x + 15, y + 15)
+
+
+class TestGameViewGomokuDiff:
+    """五子棋渲染数据逐格比对测试"""
+
+    @pytest.fixture
+    def view(self, qapp):
+        view = GameViewWidget()
+        view.set_render_data("五子棋", {"game": "gomoku", "board": _empty_board()})
+        yield view
+        view.deleteLater()
+
+    @pytest.fixture
+    def changes(self, view):
+        """记录每次 set_board 收到的 changed 参数"""
+        board = view._gomoku_board
+        calls = []
+        set_board = board.set_board
+
+        def record(grid, changed=None):
+            calls.append(changed)
+            set_board(grid, changed)
+
+        board.set_board = record
+        return calls
+
+    def _render(self, view, grid):
+        view.set_render_data("五子棋", {"game": "gomoku", "board": grid})
+
+    def test_only_changed_cells_passed(self, view, changes):
+        grid = _empty_board()
+        grid[7][7] = 1
+        self._render(view, grid)
+
+        assert changes == [[(7, 7)]]
+
+    def test_same_board_skips_repaint(self, view, changes):
+        self._render(view, _empty_board())
+
+        assert changes == []
+
+    def test_size_change_falls_back_to_full_repaint(self, view, changes):
+        self._render(view, _empty_board(9))
+
+        assert changes == [None]
+
+    def test_ragged_row_falls_back_to_full_repaint(self, view, changes):
+        """某一行长度变了，不能靠 zip 截断漏掉格子"""
+        grid = _empty_board()
+        grid[0] = grid[0] + [1]
+        self._render(view, grid)
+
+        assert changes == [None]
+
+
+class TestGameViewJson:
+    """JSON 展示测试"""
+
+    @pytest.fixture
+    def view(self, qapp):
+        view = GameViewWidget()
+        yield view
+        view.deleteLater()
+
+    def test_long_payload_keeps_head_and_marks_truncation(self, view):
+        data = {"game": "demo", "current_player": 1, "board": [[0] * 15 for _ in range(30)]}
+        view.set_render_data("演示", data)
+
+        lines = view._content.toPlainText().split("\n")
+        assert lines[0] == "{"
+        assert lines[1] == '  "game": "demo",'
+        assert lines[2] == '  "current_player": 1,'
+        assert len(lines) == GameViewWidget.MAX_JSON_LINES + 1
+        assert lines[-1].startswith("…")
+        assert "已截断" in lines[-1]
+
+    def test_short_payload_not_truncated(self, view):
+        view.set_render_data("演示", {"game": "demo", "score": 3})
+
+        text = view._content.toPlainText()
+        assert "已截断" not in text
+        assert text.endswith("}")
+
+    def test_unchanged_frame_skips_dump(self, view, monkeypatch):
+        """内容没变时在 json.dumps 之前就返回"""
+        data = {"game": "demo", "board": [[0, 0], [0, 0]]}
+        view.set_render_data("演示", data)
+
+        dumps = []
+        monkeypatch.setattr(game_view.json, "dumps", lambda *a, **kw: dumps.append(a) or "{}")
+        view.set_render_data("演示", {"game": "demo", "board": [[0, 0], [0, 0]]})
+
+        assert dumps == []
+
+    def test_in_place_mutation_is_rendered(self, view):
+        """调用方原地修改嵌套数据后再传入同一个 dict，仍然要刷新"""
+        data = {"game": "demo", "board": [[0, 0], [0, 0]]}
+        view.set_render_data("演示", data)
+        data["board"][1][1] = 2
+        view.set_render_data("演示", data)
+
+        assert "2" in view._content.toPlainText()
+
+    def test_frame_id_short_circuits(self, view, monkeypatch):
+        """带帧号时只比帧号"""
+        view.set_render_data("演示", {"game": "demo", "frame_id": 1, "score": 1})
+
+        dumps = []
+        real_dumps = game_view.json.dumps
+        monkeypatch.setattr(game_view.json, "dumps", lambda *a, **kw: dumps.append(a) or real_dumps(*a, **kw))
+        view.set_render_data("演示", {"game": "demo", "frame_id": 1, "score": 1})
+        assert dumps == []
+
+        view.set_render_data("演示", {"game": "demo", "frame_id": 2, "score": 5})
+        assert len(dumps) == 1
+        assert '"score": 5' in view._content.toPlainText()
@@ -0,0 +1,76 @@
+"""
+布局工具测试
+"""
+import pytest
+import shiboken6
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from client.shell.utils import clear_layout
+
+
+class TestClearLayout:
+    """clear_layout 测试"""
+
+    @pytest.fixture
+    def container(self, qapp):
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        for i in range(3):
+            layout.addWidget(QLabel(f"item {i}"))
+        layout.addStretch()
+        yield container
+        container.deleteLater()
+
+    def _labels(self, layout):
+        return [layout.itemAt(i).widget() for i in range(layout.count()) if layout.itemAt(i).widget()]
+
+    def _flush_deletes(self):
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def test_removes_everything_by_default(self, container):
+        layout = container.layout()
+
+        clear_layout(layout)
+
+        assert layout.count() == 0
+
+    def test_keeps_trailing_stretch(self, container):
+        layout = container.layout()
+
+        clear_layout(layout, keep_tail=1)
+
+        assert layout.count() == 1
+        assert layout.itemAt(0).spacerItem() is not None
+
+    def test_keeps_exactly_last_n_items(self, container):
+        layout = container.layout()
+        last_label = self._labels(layout)[-1]
+
+        clear_layout(layout, keep_tail=2)
+
+        assert layout.count() == 2
+        assert layout.itemAt(0).widget() is last_label
+        assert layout.itemAt(1).spacerItem() is not None
+        assert last_label.parent() is container
+
+    def test_keep_tail_beyond_count_is_noop(self, container):
+        layout = container.layout()
+
+        clear_layout(layout, keep_tail=10)
+
+        assert layout.count() == 4
+
+    def test_removed_widgets_detached_and_deleted(self, container):
+        layout = container.layout()
+        labels = self._labels(layout)
+
+        clear_layout(layout, keep_tail=1)
+
+        # 立即脱离父控件，不再参与绘制
+        assert all(label.parent() is None for label in labels)
+        assert container.findChildren(QLabel) == []
+
+        # 事件循环处理 deleteLater 后被销毁
+        self._flush_deletes()
+        assert not any(shiboken6.isValid(label) for label in labels)
@@ -0,0 +1,24 @@
+"""
+主题配置测试
+"""
+from dataclasses import fields
+
+from client.shell.styles.qss import get_stylesheet
+from client.shell.styles.theme import CURRENT_THEME
+
+
+def test_to_dict_only_exports_tokens():
+    """to_dict 只含色值等设计令牌，不夹带预编译的组件样式"""
+    tokens = CURRENT_THEME.to_dict()
+    assert set(tokens) == {f.name for f in fields(CURRENT_THEME)}
+    assert "qss" not in tokens
+    assert not any(key.startswith("qss") for key in tokens)
+
+
+def test_prebuilt_qss_follows_tokens():
+    assert CURRENT_THEME.text_display in CURRENT_THEME.qss.dialog_title
+    assert CURRENT_THEME.primary in CURRENT_THEME.qss.primary_btn
+
+
+def test_global_stylesheet_builds():
+    assert CURRENT_THEME.bg_base in get_stylesheet()